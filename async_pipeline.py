@@ -0,0 +1,223 @@
+"""Asyncio front end to the analysis pipeline.
+
+Extraction (disk reads, PDF parsing, Tesseract) and scoring run in an
+executor so the event loop is never blocked::
+
+    pipeline = AsyncPipeline(max_concurrency=4)
+    report = await pipeline.analyze_file("cv.pdf", top_k=5)
+    async for outcome in pipeline.analyze_many(paths):
+        ...
+
+The loop's default thread pool is used unless an executor is given. A
+``ProcessPoolExecutor`` suits OCR- and PDF-heavy loads; each worker process
+builds its skill extractor and role index once and reuses them, and limits
+PDF and image extraction to a single process instead of starting a pool of
+its own.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterable
+from urllib.parse import quote
+
+from resume_profiling.extraction_cache import ExtractionCache
+from resume_profiling.extractor_router import ExtractorRouter
+from resume_profiling.pipeline import analyze_resume, build_report
+from resume_profiling.report_generator import DEFAULT_REPORT_NAME
+from resume_profiling.role_index import RoleIndex
+from resume_profiling.skill_extractor import SkillExtractor
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+# Warm per-process state shared by all executor jobs of a process.
+_STATE: dict[str, Any] = {}
+_STATE_LOCK = threading.Lock()
+
+
+def _warm_state() -> tuple[SkillExtractor, RoleIndex]:
+    state = _STATE.get("warm")
+    if state is None:
+        with _STATE_LOCK:
+            state = _STATE.get("warm")
+            if state is None:
+                if multiprocessing.parent_process() is not None:
+                    # Executor processes already spread work over the cores;
+                    # PDF and OCR extraction must not fork again inside each.
+                    for file_type in ("pdf", "image"):
+                        ExtractorRouter.EXTRACTOR_MAP.configure(
+                            file_type, MAX_WORKERS=1
+                        )
+                state = (SkillExtractor(), RoleIndex.default())
+                _STATE["warm"] = state
+    return state
+
+
+def _analyze_path(
+    resume_path: str,
+    top_k: int | None,
+    cache: ExtractionCache | None,
+    output_dir: str | None,
+    report_name: str,
+) -> dict[str, Any]:
+    extractor, role_index = _warm_state()
+    return analyze_resume(
+        resume_path,
+        output_dir,
+        extractor,
+        role_index,
+        top_k=top_k,
+        cache=cache,
+        report_name=report_name,
+    )
+
+
+def _analyze_bytes(
+    data: bytes,
+    filename: str | None,
+    top_k: int | None,
+    cache: ExtractionCache | None,
+) -> dict[str, Any]:
+    extractor, role_index = _warm_state()
+    _, resume_text = ExtractorRouter.extract_and_clean_bytes(
+        data, filename, cache=cache
+    )
+    return build_report(resume_text, extractor, role_index, top_k=top_k)
+
+
+@dataclass(frozen=True)
+class AnalysisOutcome:
+    """Result of one document in ``AsyncPipeline.analyze_many``."""
+
+    source: str
+    report: dict[str, Any] | None
+    error: str | None
+
+
+class AsyncPipeline:
+    """Run resume analyses from asyncio code with bounded concurrency.
+
+    At most ``max_concurrency`` documents are in flight at once; further
+    calls wait on a semaphore without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        executor: Executor | None = None,
+        cache: ExtractionCache | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        self.executor = executor
+        self.cache = cache
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(self, function: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, function)
+
+    async def analyze_file(
+        self,
+        resume_path: str | Path,
+        top_k: int | None = None,
+        output_dir: str | Path | None = None,
+        report_name: str = DEFAULT_REPORT_NAME,
+    ) -> dict[str, Any]:
+        """Analyze a resume file.
+
+        Args:
+            resume_path: Path to resume.
+            top_k: Optional number of best roles to keep; all roles when None.
+            output_dir: Output directory for reports, or None to skip writing.
+            report_name: Base file name of the reports.
+
+        Returns:
+            Report data.
+        """
+        return await self._run(
+            partial(
+                _analyze_path,
+                str(resume_path),
+                top_k,
+                self.cache,
+                None if output_dir is None else str(output_dir),
+                report_name,
+            )
+        )
+
+    async def analyze_bytes(
+        self, data: bytes, filename: str | None = None, top_k: int | None = None
+    ) -> dict[str, Any]:
+        """Analyze an in-memory resume.
+
+        Args:
+            data: Resume file bytes.
+            filename: Optional original file name used as a type hint.
+            top_k: Optional number of best roles to keep; all roles when None.
+
+        Returns:
+            Report data.
+        """
+        return await self._run(
+            partial(_analyze_bytes, bytes(data), filename, top_k, self.cache)
+        )
+
+    async def analyze_many(
+        self,
+        resume_paths: Iterable[str | Path],
+        top_k: int | None = None,
+        output_dir: str | Path | None = None,
+    ) -> AsyncIterator[AnalysisOutcome]:
+        """Analyze several resume files, yielding outcomes as they complete.
+
+        Failures are reported in the outcome instead of being raised, so one
+        bad document does not stop the stream. With ``output_dir`` the
+        reports are named ``analysis_report_<position>_<file name>``, with
+        the file name percent-encoded, so documents sharing a name or stem
+        never overwrite each other.
+
+        Args:
+            resume_paths: Paths to resumes.
+            top_k: Optional number of best roles to keep; all roles when None.
+            output_dir: Output directory for reports, or None to skip writing.
+
+        Yields:
+            AnalysisOutcome per document, in completion order.
+        """
+
+        async def outcome(position: int, path: Path) -> AnalysisOutcome:
+            file_name = quote(path.name, safe="")
+            report_name = f"{DEFAULT_REPORT_NAME}_{position}_{file_name}"
+            try:
+                report = await self.analyze_file(
+                    path,
+                    top_k=top_k,
+                    output_dir=output_dir,
+                    report_name=report_name,
+                )
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.exception("Failed to analyze %s: %s", path, exc)
+                error = f"{type(exc).__name__}: {exc}"
+                return AnalysisOutcome(str(path), None, error)
+            return AnalysisOutcome(str(path), report, None)
+
+        tasks = [
+            asyncio.ensure_future(outcome(position, Path(path)))
+            for position, path in enumerate(resume_paths, 1)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,305 @@
+"""Batch analysis of many resumes over a process pool."""
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from urllib.parse import quote
+
+from resume_profiling.extraction_cache import ExtractionCache
+from resume_profiling.extractor_router import ExtractorRouter
+from resume_profiling.extractors.json_extractor import JsonlExtractor
+from resume_profiling.file_detector import FileDetector
+from resume_profiling.instrumentation import StageProfiler
+from resume_profiling.logger_config import configure_worker_logging, worker_log_queue
+from resume_profiling.pipeline import analyze_record, analyze_resume
+from resume_profiling.report_generator import DEFAULT_REPORT_NAME
+from resume_profiling.role_catalog import load_index
+from resume_profiling.role_index import RoleIndex
+from resume_profiling.skill_extractor import SkillExtractor
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+# A task is a label for error reporting, a worker function and its arguments.
+Task = tuple[str, Callable[..., "str | None"], tuple[str, str, str]]
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    """Outcome of a batch run."""
+
+    processed: int
+    failed: list[tuple[str, str]]
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Resumes per second."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+# Per-process state, built once by ``_init_worker`` and reused for every
+# resume the process handles.
+_WORKER_STATE: dict[str, Any] = {}
+
+# Tasks submitted ahead of completed ones, per worker. Bounds the memory held
+# by queued records when reading multi-gigabyte JSON Lines exports.
+_PENDING_PER_WORKER = 4
+
+
+def _init_worker(
+    top_k: int | None,
+    cache: ExtractionCache | None,
+    stream: bool = False,
+    timings: bool = False,
+    log_queue: Any | None = None,
+    log_level: int = logging.INFO,
+    matcher_dir: Path | None = None,
+    roles_path: str | None = None,
+    extractor_workers: int | None = None,
+) -> None:
+    if log_queue is not None:
+        configure_worker_logging(log_queue, log_level)
+    if extractor_workers is not None:
+        # Pool workers already use every core; PDF and OCR extraction must
+        # not start a process pool of their own inside each of them.
+        for file_type in ("pdf", "image"):
+            ExtractorRouter.EXTRACTOR_MAP.configure(
+                file_type, MAX_WORKERS=extractor_workers
+            )
+    if matcher_dir is not None:
+        # Spawned workers do not inherit the class default set by the CLI.
+        SkillExtractor.ARTIFACT_DIR = matcher_dir
+    _WORKER_STATE["extractor"] = SkillExtractor()
+    # Workers load a catalogue's cached index instead of rebuilding it.
+    _WORKER_STATE["role_index"] = (
+        load_index(roles_path) if roles_path else RoleIndex.default()
+    )
+    _WORKER_STATE["top_k"] = top_k
+    _WORKER_STATE["cache"] = cache
+    _WORKER_STATE["stream"] = stream
+    _WORKER_STATE["timings"] = timings
+
+
+def _profiler() -> StageProfiler | None:
+    return StageProfiler() if _WORKER_STATE["timings"] else None
+
+
+def _process_resume(
+    resume_path: str, output_dir: str, report_name: str
+) -> str | None:
+    """Analyze one resume with the warm worker state; return an error or None."""
+    try:
+        analyze_resume(
+            resume_path,
+            output_dir,
+            extractor=_WORKER_STATE["extractor"],
+            role_index=_WORKER_STATE["role_index"],
+            top_k=_WORKER_STATE["top_k"],
+            cache=_WORKER_STATE["cache"],
+            report_name=report_name,
+            stream=_WORKER_STATE["stream"],
+            profiler=_profiler(),
+        )
+        return None
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.exception("Failed to analyze %s: %s", resume_path, exc)
+        return f"{type(exc).__name__}: {exc}"
+
+
+def _process_record(record: str, output_dir: str, report_name: str) -> str | None:
+    """Analyze one JSON Lines record with the warm worker state."""
+    try:
+        analyze_record(
+            record,
+            output_dir,
+            extractor=_WORKER_STATE["extractor"],
+            role_index=_WORKER_STATE["role_index"],
+            top_k=_WORKER_STATE["top_k"],
+            report_name=report_name,
+            profiler=_profiler(),
+        )
+        return None
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.exception("Failed to analyze record %s: %s", report_name, exc)
+        return f"{type(exc).__name__}: {exc}"
+
+
+def discover_resumes(resume_dir: str | Path, pattern: str = "*") -> list[Path]:
+    """List supported resume files under a directory matching a glob pattern.
+
+    Args:
+        resume_dir: Directory to search, or a single resume file.
+        pattern: Glob pattern relative to ``resume_dir``.
+
+    Returns:
+        Sorted list of file paths.
+    """
+    root = Path(resume_dir)
+    if root.is_file():
+        return [root]
+    if not root.is_dir():
+        raise FileNotFoundError(f"Resume directory not found: {root}")
+    return sorted(
+        path
+        for path in root.glob(pattern)
+        if path.is_file() and path.suffix.lower() in FileDetector.SUPPORTED_EXTENSIONS
+    )
+
+
+def report_name_for(resume_path: Path, resume_dir: Path) -> str:
+    """Derive a unique report base name from a resume's relative path.
+
+    The relative path is percent-encoded, so distinct paths always give
+    distinct names and the path can be recovered with ``unquote``.
+    """
+    relative = resume_path.relative_to(resume_dir).as_posix()
+    return f"{DEFAULT_REPORT_NAME}_{quote(relative, safe='')}"
+
+
+def _check_report_names(resumes: list[Path], root: Path) -> None:
+    """Reject resumes whose reports would overwrite each other.
+
+    Percent-encoded names only clash on case-insensitive file systems, so
+    names are compared case-folded.
+
+    Raises:
+        ValueError: If two resumes map to the same report name.
+    """
+    seen: dict[str, Path] = {}
+    for path in resumes:
+        name = report_name_for(path, root).casefold()
+        previous = seen.setdefault(name, path)
+        if previous != path:
+            raise ValueError(
+                f"Resumes {previous} and {path} would share report {name}"
+            )
+
+
+def _iter_tasks(resumes: list[Path], root: Path, output_dir: str) -> Iterator[Task]:
+    """Yield one task per resume file, or per record of a JSON Lines file.
+
+    Records are reported as ``<report name>_<line number>``.
+    """
+    for path in resumes:
+        name = report_name_for(path, root)
+        if path.suffix.lower() == ".jsonl":
+            for line_number, record in JsonlExtractor.iter_records(path):
+                yield (
+                    f"{path}:{line_number}",
+                    _process_record,
+                    (record, output_dir, f"{name}_{line_number}"),
+                )
+        else:
+            yield str(path), _process_resume, (str(path), output_dir, name)
+
+
+def _run_pool(
+    tasks: Iterator[Task], workers: int, initargs: tuple[Any, ...]
+) -> Iterator[tuple[str, str | None]]:
+    """Run tasks in a process pool with a bounded number in flight."""
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=initargs
+    ) as pool:
+        pending: deque[tuple[str, Future]] = deque()
+        for label, function, args in tasks:
+            pending.append((label, pool.submit(function, *args)))
+            if len(pending) >= workers * _PENDING_PER_WORKER:
+                label, future = pending.popleft()
+                yield label, future.result()
+        while pending:
+            label, future = pending.popleft()
+            yield label, future.result()
+
+
+def run_batch(
+    resume_dir: str | Path,
+    output_dir: str | Path,
+    pattern: str = "*",
+    workers: int | None = None,
+    top_k: int | None = None,
+    cache: ExtractionCache | None = None,
+    stream: bool = False,
+    timings: bool = False,
+    roles_path: str | None = None,
+) -> BatchSummary:
+    """Analyze every matching resume in a directory.
+
+    Each worker process builds its ``SkillExtractor`` and role index once and
+    reuses them for all resumes it handles. Reports are written as
+    ``analysis_report_<relative path>.json`` and ``.txt`` so concurrent
+    resumes never overwrite each other. Every record of a JSON Lines file is
+    analyzed as a resume of its own.
+
+    Args:
+        resume_dir: Directory containing resumes, or a single resume file.
+        output_dir: Output directory for reports.
+        pattern: Glob pattern relative to ``resume_dir``.
+        workers: Number of worker processes (default: CPU count).
+        top_k: Optional number of best roles to keep; all roles when None.
+        cache: Optional extraction cache shared by all workers.
+        stream: Process each resume chunk by chunk to bound worker memory.
+        timings: Add per-stage timings to every report.
+        roles_path: Optional role catalogue file instead of the built-in
+            roles.
+
+    Returns:
+        BatchSummary with counts, failures and elapsed time.
+    """
+    root = Path(resume_dir)
+    resumes = discover_resumes(root, pattern)
+    if root.is_file():
+        root = root.parent
+    workers = max(1, workers or os.cpu_count() or 1)
+    if not any(path.suffix.lower() == ".jsonl" for path in resumes):
+        workers = max(1, min(workers, len(resumes)))
+    _check_report_names(resumes, root)
+    LOGGER.info("Batch of %d files with %d workers", len(resumes), workers)
+
+    tasks = _iter_tasks(resumes, root, str(output_dir))
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(top_k, cache, stream, timings, roles_path=roles_path)
+        results = ((label, function(*args)) for label, function, args in tasks)
+    else:
+        # Compile the default matcher once here; forked workers inherit it
+        # from the process-wide registry instead of compiling their own.
+        SkillExtractor()
+        log_level = logging.getLogger().level
+        initargs = (
+            top_k,
+            cache,
+            stream,
+            timings,
+            worker_log_queue(),
+            log_level,
+            SkillExtractor.ARTIFACT_DIR,
+            roles_path,
+            1,
+        )
+        results = _run_pool(tasks, workers, initargs)
+
+    processed = 0
+    failed: list[tuple[str, str]] = []
+    for label, error in results:
+        processed += 1
+        if error is not None:
+            failed.append((label, error))
+    elapsed = time.perf_counter() - start
+
+    summary = BatchSummary(processed=processed, failed=failed, elapsed=elapsed)
+    LOGGER.info(
+        "Batch completed: %d resumes, %d failed, %.2fs, %.1f resumes/s",
+        summary.processed,
+        len(summary.failed),
+        summary.elapsed,
+        summary.throughput,
+    )
+    return summary
@@ -0,0 +1,96 @@
+"""DOCX extraction benchmark: streaming XML engine versus python-docx.
+
+Builds a template-heavy document (many tables, header and footer) with
+python-docx, or uses the given file, then reports time per extraction, peak
+traced memory and extracted text size for both ``DocxExtractor`` engines.
+tracemalloc only sees Python allocations, so the lxml trees built by
+python-docx are undercounted.
+
+Usage:
+    python benchmarks/docx_benchmark.py [--file CV.docx] [--runs N]
+        [--paragraphs N] [--tables N]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).absolute().parents[1]
+if __package__ in (None, ""):
+    sys.path.insert(0, str(PACKAGE_DIR.parent))
+
+from resume_profiling.extractors.docx_extractor import DocxExtractor  # noqa: E402
+
+
+WORDS = (
+    "python", "sql", "docker", "kubernetes", "react", "aws", "led", "built",
+    "team", "machine", "learning", "pipelines", "delivered", "platform",
+)
+
+
+def build_document(path: Path, paragraphs: int, tables: int) -> None:
+    """Write a resume-like DOCX with tables, a header and a footer."""
+    from docx import Document
+
+    rng = random.Random(0)
+    document = Document()
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Jane Doe | jane@example.com"
+    section.footer.paragraphs[0].text = "References available on request"
+    every = max(paragraphs // max(tables, 1), 1)
+    for idx in range(paragraphs):
+        document.add_paragraph(" ".join(rng.choice(WORDS) for _ in range(20)))
+        if tables and idx % every == 0:
+            table = document.add_table(rows=8, cols=3)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = " ".join(rng.choice(WORDS) for _ in range(3))
+    document.save(str(path))
+
+
+def measure(path: Path, engine: str, runs: int) -> tuple[float, int, int]:
+    """Return median seconds, peak traced bytes and text length."""
+    timings: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        DocxExtractor.extract_text(path, engine=engine)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    text = DocxExtractor.extract_text(path, engine=engine)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    timings.sort()
+    return timings[len(timings) // 2], peak, len(text)
+
+
+def main() -> None:
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description="DOCX extraction benchmark")
+    parser.add_argument("--file", default=None, help="DOCX file to extract")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per engine")
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--tables", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.file:
+            path = Path(args.file)
+        else:
+            path = Path(workdir) / "template_heavy.docx"
+            build_document(path, args.paragraphs, args.tables)
+        print(f"file: {path.name} ({path.stat().st_size / 1024:.0f} KiB)")
+        for engine in DocxExtractor.ENGINES:
+            median, peak, length = measure(path, engine, args.runs)
+            print(
+                f"{engine:>12}: {median * 1000:8.1f} ms  "
+                f"peak {peak / 1024 / 1024:6.1f} MiB  text {length} chars"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Startup benchmark for the CLI on a plain-text resume.
+
+Runs ``python -X importtime -m resume_profiling.main`` on the bundled TXT
+samples, reports the wall-clock time per invocation and fails if any heavy
+extractor backend was imported along the way.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs N]
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+PACKAGE_DIR = Path(__file__).absolute().parents[1]
+HEAVY_MODULES = ("PyPDF2", "docx", "PIL", "pytesseract", "lxml")
+
+
+def imported_modules(importtime_output: str) -> set[str]:
+    """Parse ``-X importtime`` output into the set of imported module names."""
+    modules: set[str] = set()
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        name = line.rsplit("|", 1)[1].strip()
+        if name and name != "imported package":
+            modules.add(name)
+    return modules
+
+
+def run_once(output_dir: str) -> tuple[float, set[str]]:
+    """Run the CLI once and return wall time and imported modules."""
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-m",
+        "resume_profiling.main",
+        "--resume",
+        str(PACKAGE_DIR / "data_samples" / "sample_resume.txt"),
+        "--job",
+        str(PACKAGE_DIR / "data_samples" / "sample_job.txt"),
+        "--output",
+        output_dir,
+        "--log",
+        str(Path(output_dir) / "benchmark.log"),
+    ]
+    start = time.perf_counter()
+    completed = subprocess.run(
+        command,
+        cwd=PACKAGE_DIR.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, imported_modules(completed.stderr)
+
+
+def main() -> None:
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description="CLI startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+
+    timings: list[float] = []
+    heavy: set[str] = set()
+    with tempfile.TemporaryDirectory() as output_dir:
+        for _ in range(args.runs):
+            elapsed, modules = run_once(output_dir)
+            timings.append(elapsed)
+            heavy |= {
+                module
+                for module in modules
+                if module.split(".")[0] in HEAVY_MODULES
+            }
+
+    timings.sort()
+    print(f"runs: {len(timings)}")
+    print(f"min: {timings[0] * 1000:.1f} ms")
+    print(f"median: {timings[len(timings) // 2] * 1000:.1f} ms")
+    if heavy:
+        print(f"heavy modules imported: {', '.join(sorted(heavy))}")
+        sys.exit(1)
+    print("heavy modules imported: none")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Helpers for in-memory document sources."""
+from __future__ import annotations
+
+from typing import BinaryIO, Union
+
+
+BinarySource = Union[bytes, bytearray, memoryview, BinaryIO]
+
+
+def read_bytes(source: BinarySource) -> bytes:
+    """Return the content of an in-memory source as bytes.
+
+    Args:
+        source: Bytes-like object or binary file object positioned at the
+            start of the document.
+
+    Returns:
+        Document bytes.
+
+    Raises:
+        TypeError: If the source is neither bytes-like nor readable.
+    """
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, "read"):
+        data = source.read()
+        if not isinstance(data, bytes):
+            raise TypeError("File object must be opened in binary mode")
+        return data
+    raise TypeError(f"Unsupported source type: {type(source).__name__}")
@@ -0,0 +1,357 @@
+"""Serialized skill matcher artifacts, loaded instead of compiled at startup.
+
+An artifact holds the normalized skill list (a skill's position is its ID)
+and the trie of the ``"trie"`` engine. It is stored as
+``<directory>/skills-<hash>.v<format>.matcher.json`` where ``hash`` is the
+SHA-256 of the dictionary as given, so editing the dictionary selects a new
+artifact and the old one is never read. Build artifacts ahead of time with::
+
+    python -m resume_profiling.compiled_matcher DIR [--dictionary FILE]
+
+or let ``CompiledMatcher.load_or_build`` write them on first use.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, TypeVar
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from resume_profiling.skill_trie import SkillTrie
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+FORMAT_VERSION = 1
+ARTIFACT_SUFFIX = ".matcher.json"
+
+T = TypeVar("T")
+
+
+def normalize_dictionary(skill_dictionary: Iterable[str]) -> list[str]:
+    """Return the sorted, lowercased and deduplicated skill list."""
+    return sorted({skill.lower() for skill in skill_dictionary})
+
+
+def dictionary_hash(skill_dictionary: Iterable[str]) -> str:
+    """Return the SHA-256 hex digest identifying a skill dictionary."""
+    material = json.dumps([FORMAT_VERSION, list(skill_dictionary)])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledMatcher:
+    """Normalized skills and their trie, ready for ``SkillExtractor``."""
+
+    dictionary_hash: str
+    skills: list[str]
+    trie: SkillTrie
+
+    @classmethod
+    def build(cls, skill_dictionary: Iterable[str]) -> CompiledMatcher:
+        """Compile a skill dictionary.
+
+        Args:
+            skill_dictionary: Skills as passed to ``SkillExtractor``.
+
+        Returns:
+            CompiledMatcher instance.
+        """
+        dictionary = list(skill_dictionary)
+        skills = normalize_dictionary(dictionary)
+        return cls(dictionary_hash(dictionary), skills, SkillTrie(skills))
+
+    @staticmethod
+    def artifact_path(directory: str | Path, digest: str) -> Path:
+        """Return the artifact file of a dictionary hash inside a directory."""
+        name = f"skills-{digest[:32]}.v{FORMAT_VERSION}{ARTIFACT_SUFFIX}"
+        return Path(directory) / name
+
+    @classmethod
+    def load(
+        cls, path: str | Path, expected_hash: str | None = None
+    ) -> CompiledMatcher | None:
+        """Load an artifact.
+
+        Args:
+            path: Artifact file.
+            expected_hash: Optional dictionary hash the artifact must carry.
+
+        Returns:
+            CompiledMatcher, or None when the file is missing, unreadable,
+            of another format version or built from another dictionary.
+        """
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+            if payload["format"] != FORMAT_VERSION:
+                return None
+            digest = payload["dictionary_hash"]
+            if expected_hash is not None and digest != expected_hash:
+                return None
+            return cls(digest, payload["skills"], SkillTrie.from_payload(payload))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: str | Path) -> None:
+        """Write the artifact atomically.
+
+        Args:
+            path: Artifact file.
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": FORMAT_VERSION,
+            "dictionary_hash": self.dictionary_hash,
+            "skills": self.skills,
+            **self.trie.to_payload(),
+        }
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, target)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load_or_build(
+        cls, skill_dictionary: Iterable[str], directory: str | Path
+    ) -> CompiledMatcher:
+        """Load the artifact of a dictionary, building and saving it if needed.
+
+        A read-only or unwritable directory only costs the compilation.
+
+        Args:
+            skill_dictionary: Skills as passed to ``SkillExtractor``.
+            directory: Artifact directory.
+
+        Returns:
+            CompiledMatcher instance.
+        """
+        dictionary = list(skill_dictionary)
+        digest = dictionary_hash(dictionary)
+        path = cls.artifact_path(directory, digest)
+        matcher = cls.load(path, expected_hash=digest)
+        if matcher is not None:
+            LOGGER.info("Loaded skill matcher artifact %s", path)
+            return matcher
+
+        matcher = cls.build(dictionary)
+        try:
+            matcher.save(path)
+            LOGGER.info("Wrote skill matcher artifact %s", path)
+        except OSError as exc:
+            LOGGER.warning("Failed to write skill matcher artifact %s: %s", path, exc)
+        return matcher
+
+
+def estimate_size(obj: Any) -> int:
+    """Approximate the memory held by a compiled matcher, in bytes.
+
+    Follows containers and object attributes, counting every object once.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__"):
+            stack.append(vars(item))
+    return total
+
+
+class MatcherRegistry:
+    """Process-wide store of compiled matchers shared by skill extractors.
+
+    Entries are keyed by engine and dictionary hash, so every extractor
+    built from identical dictionaries uses one compiled matcher. Pinned
+    entries (the built-in dictionary) are kept for the life of the process.
+    The others are evicted least recently used first once there are more
+    than ``max_entries`` of them or their estimated size (``estimate_size``)
+    exceeds ``max_bytes``; the entry just added is never evicted.
+    Compiled matchers are never mutated, so entries built before a fork are
+    shared copy-on-write with the children, and a child resets the lock.
+    """
+
+    MAX_ENTRIES = 256
+    MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self.max_bytes = max_bytes or self.MAX_BYTES
+        self._entries: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._pinned: dict[tuple[str, str], Any] = {}
+        self._sizes: dict[tuple[str, str], int] = {}
+        self._memory = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated size of the evictable entries."""
+        return self._memory
+
+    def get(
+        self,
+        engine: str,
+        digest: str,
+        build: Callable[[], T],
+        pinned: bool = False,
+    ) -> T:
+        """Return the matcher of a dictionary, building it on first request.
+
+        Args:
+            engine: Matching engine the matcher belongs to.
+            digest: Dictionary hash from ``dictionary_hash``.
+            build: Compiles the matcher on a miss. Runs without the lock;
+                when two threads race, the first stored result wins.
+            pinned: Keep the entry regardless of the LRU bounds.
+
+        Returns:
+            Shared matcher object.
+        """
+        key = (engine, digest)
+        with self._lock:
+            matcher = self._pinned.get(key)
+            if matcher is None:
+                matcher = self._entries.get(key)
+                if matcher is not None:
+                    self._entries.move_to_end(key)
+            if matcher is not None:
+                self.hits += 1
+                return matcher
+            self.misses += 1
+
+        matcher = build()
+        size = estimate_size(matcher)
+        with self._lock:
+            if pinned:
+                self._sizes.setdefault(key, size)
+                return self._pinned.setdefault(key, matcher)
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing
+            self._entries[key] = matcher
+            self._sizes[key] = size
+            self._memory += size
+            self._evict(key)
+        return matcher
+
+    def _evict(self, keep: tuple[str, str]) -> None:
+        """Drop least recently used entries until within bounds; lock held."""
+        while (
+            len(self._entries) > self.max_entries or self._memory > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            if key == keep:
+                break
+            del self._entries[key]
+            size = self._sizes.pop(key)
+            self._memory -= size
+            self.evictions += 1
+            LOGGER.info(
+                "Evicted %s skill matcher %s (%d bytes)", key[0], key[1][:12], size
+            )
+
+    def stats(self) -> dict[str, int]:
+        """Return entry counts, estimated memory and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "pinned": len(self._pinned),
+                "memory_bytes": self._memory,
+                "pinned_bytes": sum(self._sizes[key] for key in self._pinned),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        """Drop every entry, pinned ones included."""
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self._sizes.clear()
+            self._memory = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned)
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+
+MATCHER_REGISTRY = MatcherRegistry()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=MATCHER_REGISTRY._after_fork)
+
+
+def main() -> None:
+    """Build the matcher artifact of a dictionary ahead of deployment."""
+    parser = argparse.ArgumentParser(description="Build a skill matcher artifact")
+    parser.add_argument("directory", help="Artifact directory")
+    parser.add_argument(
+        "--dictionary",
+        default=None,
+        help="Optional text file with one skill per line "
+        "(default: built-in SKILL_DICTIONARY)",
+    )
+    args = parser.parse_args()
+
+    if args.dictionary:
+        lines = Path(args.dictionary).read_text(encoding="utf-8").splitlines()
+        dictionary = [line.strip() for line in lines if line.strip()]
+    else:
+        from resume_profiling.skill_extractor import SKILL_DICTIONARY
+
+        dictionary = list(SKILL_DICTIONARY)
+
+    start = time.perf_counter()
+    matcher = CompiledMatcher.build(dictionary)
+    build_time = time.perf_counter() - start
+    path = CompiledMatcher.artifact_path(args.directory, matcher.dictionary_hash)
+    matcher.save(path)
+    start = time.perf_counter()
+    CompiledMatcher.load(path)
+    load_time = time.perf_counter() - start
+    print(
+        f"{path}: {len(matcher.skills)} skills, "
+        f"build {build_time * 1000:.2f} ms, load {load_time * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
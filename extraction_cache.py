@@ -0,0 +1,199 @@
+"""Content-addressed on-disk cache for extracted text."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Cached extraction output for one document."""
+
+    raw_text: str
+    cleaned_text: str
+
+
+class ExtractionCache:
+    """Size-bounded LRU cache of extracted text keyed by content hash.
+
+    Entries live in ``<directory>/<aa>/<key>.json`` where ``key`` hashes the
+    document bytes together with the extractor name, version and settings.
+    Writes go to a temporary file that is atomically renamed into place,
+    reads and evictions tolerate entries vanishing underneath them, so
+    several worker processes can share one directory without locking. Hits
+    refresh the entry modification time, and eviction removes the least
+    recently used entries once the directory grows past ``max_bytes``.
+    Temporary files left behind by a crashed writer count towards the size
+    and are removed by eviction once older than ``STALE_TMP_SECONDS``.
+
+    The directory size is measured on the first ``put`` and re-measured
+    whenever this instance has written more than ``RESCAN_FRACTION`` of
+    ``max_bytes`` since the last scan, so writes from other processes are
+    picked up and the shared directory cannot grow far past the budget.
+    """
+
+    ENTRY_SUFFIX = ".json"
+    TMP_SUFFIX = ".tmp"
+    STALE_TMP_SECONDS = 3600
+    LOW_WATERMARK = 0.9
+    RESCAN_FRACTION = 0.1
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._size_estimate: int | None = None
+        self._written_since_scan = 0
+
+    @classmethod
+    def hash_file(cls, file_path: str | Path) -> str:
+        """Return the SHA-256 hex digest of a file's bytes."""
+        digest = hashlib.sha256()
+        with Path(file_path).open("rb") as handle:
+            for chunk in iter(lambda: handle.read(cls.CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """Return the SHA-256 hex digest of in-memory content."""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def make_key(
+        content_hash: str, extractor_name: str, extractor_version: str
+    ) -> str:
+        """Combine content hash and extractor identity into a cache key."""
+        material = f"{extractor_name}:{extractor_version}:{content_hash}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the cached entry for a key, or None on a miss.
+
+        Args:
+            key: Cache key from ``make_key``.
+
+        Returns:
+            CacheEntry or None.
+        """
+        path = self._entry_path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            entry = CacheEntry(
+                raw_text=payload["raw_text"], cleaned_text=payload["cleaned_text"]
+            )
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        LOGGER.info("Extraction cache hit: %s", key)
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting old entries if the cache is over budget.
+
+        Args:
+            key: Cache key from ``make_key``.
+            entry: Extraction output to store.
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {"raw_text": entry.raw_text, "cleaned_text": entry.cleaned_text}
+        ).encode("utf-8")
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=self.TMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            LOGGER.warning("Failed to write extraction cache entry %s: %s", key, exc)
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            return
+
+        self._written_since_scan += len(payload)
+        if (
+            self._size_estimate is None
+            or self._written_since_scan > self.max_bytes * self.RESCAN_FRACTION
+        ):
+            self._size_estimate = self._disk_size()
+            self._written_since_scan = 0
+        else:
+            self._size_estimate += len(payload)
+        if self._size_estimate > self.max_bytes:
+            self.evict()
+
+    def _scan(self, suffix: str) -> list[tuple[Path, int, float]]:
+        entries: list[tuple[Path, int, float]] = []
+        for path in self.directory.glob(f"*/*{suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _disk_size(self) -> int:
+        return sum(
+            size
+            for suffix in (self.ENTRY_SUFFIX, self.TMP_SUFFIX)
+            for _, size, _ in self._scan(suffix)
+        )
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under the low watermark.
+
+        Stale temporary files are removed first; recent ones may belong to a
+        write in progress and are left alone.
+        """
+        stale_before = time.time() - self.STALE_TMP_SECONDS
+        removed_tmp = 0
+        for path, _, mtime in self._scan(self.TMP_SUFFIX):
+            if mtime < stale_before:
+                try:
+                    path.unlink()
+                    removed_tmp += 1
+                except OSError:
+                    continue
+        if removed_tmp:
+            LOGGER.info("Removed %d stale temporary cache files", removed_tmp)
+
+        entries = self._scan(self.ENTRY_SUFFIX)
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * self.LOW_WATERMARK)
+        removed = 0
+        for path, size, _ in sorted(entries, key=lambda item: item[2]):
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                total -= size
+                continue
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._size_estimate = total
+        self._written_since_scan = 0
+        LOGGER.info("Evicted %d extraction cache entries", removed)
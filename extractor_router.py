@@ -1,42 +1,274 @@
 """Extractor router to select appropriate extractor based on file type."""
 from __future__ import annotations
 
+import importlib
 import logging
 from pathlib import Path
+from typing import Callable, Iterator, Mapping
 
+from resume_profiling.byte_source import BinarySource, read_bytes
+from resume_profiling.extraction_cache import CacheEntry, ExtractionCache
 from resume_profiling.file_detector import FileDetector
-from resume_profiling.extractors.docx_extractor import DocxExtractor
-from resume_profiling.extractors.image_ocr_extractor import ImageOCRExtractor
-from resume_profiling.extractors.json_extractor import JsonExtractor
-from resume_profiling.extractors.pdf_extractor import PdfExtractor
-from resume_profiling.extractors.txt_extractor import TxtExtractor
+from resume_profiling.instrumentation import NULL_PROFILER, StageProfiler
+from resume_profiling.text_cleaner import TextCleaner
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+class LazyExtractorMap(Mapping[str, type]):
+    """Map file types to extractor classes, importing each on first use.
+
+    Extractor backends pull in heavy libraries (PyPDF2, python-docx, Pillow,
+    pytesseract), so they are only imported when a file of their type is
+    actually routed.
+    """
+
+    def __init__(self, targets: dict[str, str]) -> None:
+        self._targets = targets
+        self._resolved: dict[str, type] = {}
+        self._settings: dict[str, dict[str, object]] = {}
+
+    def __getitem__(self, file_type: str) -> type:
+        extractor_cls = self._resolved.get(file_type)
+        if extractor_cls is None:
+            module_name, _, class_name = self._targets[file_type].partition(":")
+            module = importlib.import_module(module_name)
+            extractor_cls = getattr(module, class_name)
+            for name, value in self._settings.get(file_type, {}).items():
+                setattr(extractor_cls, name, value)
+            self._resolved[file_type] = extractor_cls
+        return extractor_cls
+
+    def configure(self, file_type: str, **settings: object) -> None:
+        """Set class attributes of an extractor without importing it.
+
+        The attributes are applied when the extractor is first resolved, or
+        immediately if it already was.
+
+        Args:
+            file_type: File type of the extractor.
+            **settings: Class attribute values, e.g. ``MAX_WORKERS=1``.
+        """
+        if file_type not in self._targets:
+            raise KeyError(file_type)
+        self._settings.setdefault(file_type, {}).update(settings)
+        extractor_cls = self._resolved.get(file_type)
+        if extractor_cls is not None:
+            for name, value in settings.items():
+                setattr(extractor_cls, name, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+
 class ExtractorRouter:
     """Route files to the correct extractor implementation."""
 
-    EXTRACTOR_MAP = {
-        "txt": TxtExtractor,
-        "pdf": PdfExtractor,
-        "docx": DocxExtractor,
-        "json": JsonExtractor,
-        "image": ImageOCRExtractor,
-    }
+    EXTRACTOR_MAP = LazyExtractorMap({
+        "txt": "resume_profiling.extractors.txt_extractor:TxtExtractor",
+        "pdf": "resume_profiling.extractors.pdf_extractor:PdfExtractor",
+        "docx": "resume_profiling.extractors.docx_extractor:DocxExtractor",
+        "json": "resume_profiling.extractors.json_extractor:JsonExtractor",
+        "jsonl": "resume_profiling.extractors.json_extractor:JsonlExtractor",
+        "image": "resume_profiling.extractors.image_ocr_extractor:ImageOCRExtractor",
+    })
 
     @classmethod
-    def extract(cls, file_path: str | Path) -> str:
+    def extract(
+        cls, file_path: str | Path, cache: ExtractionCache | None = None
+    ) -> str:
         """Extract text from a file by routing to the correct extractor.
 
         Args:
             file_path: Path to the file.
+            cache: Optional extraction cache consulted before parsing.
 
         Returns:
             Extracted text.
         """
-        file_type = FileDetector.detect(file_path)
-        extractor_cls = cls.EXTRACTOR_MAP[file_type]
+        if cache is not None:
+            return cls.extract_and_clean(file_path, cache=cache)[0]
+        _, _, extract = cls._route_file(file_path)
+        return extract()
+
+    @classmethod
+    def extract_and_clean(
+        cls,
+        file_path: str | Path,
+        cache: ExtractionCache | None = None,
+        profiler: StageProfiler | None = None,
+    ) -> tuple[str, str]:
+        """Extract and clean text, reusing cached output for identical bytes.
+
+        Args:
+            file_path: Path to the file.
+            cache: Optional extraction cache keyed by content hash, extractor
+                version and settings. Without it the file is always parsed.
+            profiler: Optional profiler timing the ``extract`` and ``clean``
+                stages.
+
+        Returns:
+            Tuple of raw extracted text and cleaned text.
+        """
+        profiler = profiler or NULL_PROFILER
+        with profiler.stage("extract"):
+            extractor_cls, content_hash, extract = cls._route_file(file_path)
+        return cls._extract_cached(
+            extractor_cls, content_hash, extract, cache, profiler
+        )
+
+    @classmethod
+    def iter_extract(cls, file_path: str | Path) -> Iterator[str]:
+        """Extract text from a file as a stream of chunks.
+
+        Extractors providing ``iter_text`` (TXT, PDF) stream their output;
+        other types, and files small enough to have been read by type
+        sniffing, are yielded as a single chunk. The extraction cache is not
+        used since it stores the full text.
+
+        Args:
+            file_path: Path to the file.
+
+        Yields:
+            Raw text chunks in document order.
+        """
+        detected = FileDetector.detect_file(file_path)
+        extractor_cls = cls.EXTRACTOR_MAP[detected.file_type]
+        LOGGER.info("Streaming %s through %s", file_path, extractor_cls.__name__)
+        iter_text = getattr(extractor_cls, "iter_text", None)
+        if detected.complete:
+            yield extractor_cls.extract_bytes(detected.header)
+        elif iter_text is None:
+            yield extractor_cls.extract_text(file_path)
+        else:
+            yield from iter_text(file_path)
+
+    @classmethod
+    def _route_file(
+        cls, file_path: str | Path
+    ) -> tuple[type, Callable[[], str], Callable[[], str]]:
+        """Pick the extractor for a file and bind its hash and extract steps.
+
+        Small files are read in full by the type sniffing, so they are hashed
+        and extracted from those bytes instead of opening the file again.
+        """
+        detected = FileDetector.detect_file(file_path)
+        extractor_cls = cls.EXTRACTOR_MAP[detected.file_type]
         LOGGER.info("Routing %s to %s", file_path, extractor_cls.__name__)
-        return extractor_cls.extract_text(file_path)
+        if detected.complete:
+            data = detected.header
+            return (
+                extractor_cls,
+                lambda: ExtractionCache.hash_bytes(data),
+                lambda: extractor_cls.extract_bytes(data),
+            )
+        return (
+            extractor_cls,
+            lambda: ExtractionCache.hash_file(file_path),
+            lambda: extractor_cls.extract_text(file_path),
+        )
+
+    @classmethod
+    def extract_bytes(
+        cls,
+        source: BinarySource,
+        filename: str | None = None,
+        cache: ExtractionCache | None = None,
+    ) -> str:
+        """Extract text from in-memory content without touching the disk.
+
+        Args:
+            source: Bytes, memoryview or binary file object.
+            filename: Optional original file name used as a type hint.
+            cache: Optional extraction cache consulted before parsing.
+
+        Returns:
+            Extracted text.
+        """
+        return cls.extract_and_clean_bytes(source, filename, cache=cache)[0]
+
+    @classmethod
+    def extract_and_clean_bytes(
+        cls,
+        source: BinarySource,
+        filename: str | None = None,
+        cache: ExtractionCache | None = None,
+        profiler: StageProfiler | None = None,
+    ) -> tuple[str, str]:
+        """Extract and clean in-memory content.
+
+        Args:
+            source: Bytes, memoryview or binary file object.
+            filename: Optional original file name used as a type hint.
+            cache: Optional extraction cache keyed by content hash, extractor
+                version and settings.
+            profiler: Optional profiler timing the ``extract`` and ``clean``
+                stages.
+
+        Returns:
+            Tuple of raw extracted text and cleaned text.
+        """
+        profiler = profiler or NULL_PROFILER
+        with profiler.stage("extract"):
+            data = read_bytes(source)
+            file_type = FileDetector.detect_bytes(data, filename)
+            extractor_cls = cls.EXTRACTOR_MAP[file_type]
+        LOGGER.info("Routing in-memory %s to %s", filename, extractor_cls.__name__)
+        return cls._extract_cached(
+            extractor_cls,
+            lambda: ExtractionCache.hash_bytes(data),
+            lambda: extractor_cls.extract_bytes(data),
+            cache,
+            profiler,
+        )
+
+    @staticmethod
+    def _cache_version(extractor_cls: type) -> str:
+        """Identify everything besides the content that shapes a cache entry.
+
+        Extractors with output-changing settings expose ``cache_token``;
+        the others are identified by ``VERSION``. The text cleaning engine
+        is included since entries also hold the cleaned text.
+        """
+        cache_token = getattr(extractor_cls, "cache_token", None)
+        version = cache_token() if cache_token else extractor_cls.VERSION
+        return f"{version};clean={TextCleaner.ENGINE}"
+
+    @staticmethod
+    def _extract_cached(
+        extractor_cls: type,
+        content_hash: Callable[[], str],
+        extract: Callable[[], str],
+        cache: ExtractionCache | None,
+        profiler: StageProfiler = NULL_PROFILER,
+    ) -> tuple[str, str]:
+        """Run an extraction and cleaning step through the optional cache."""
+        key = None
+        if cache is not None:
+            with profiler.stage("cache"):
+                key = ExtractionCache.make_key(
+                    content_hash(),
+                    extractor_cls.__name__,
+                    ExtractorRouter._cache_version(extractor_cls),
+                )
+                entry = cache.get(key)
+            if entry is not None:
+                profiler.count("cache_hits")
+                return entry.raw_text, entry.cleaned_text
+
+        with profiler.stage("extract"):
+            raw_text = extract()
+        with profiler.stage("clean"):
+            cleaned_text = TextCleaner.clean(raw_text)
+        profiler.count("raw_chars", len(raw_text))
+        profiler.count("clean_chars", len(cleaned_text))
+        if cache is not None:
+            with profiler.stage("cache"):
+                cache.put(
+                    key, CacheEntry(raw_text=raw_text, cleaned_text=cleaned_text)
+                )
+        return raw_text, cleaned_text
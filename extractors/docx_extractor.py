@@ -1,35 +1,246 @@
-"""DOCX file extractor using python-docx."""
+"""DOCX file extractor reading the WordprocessingML parts directly."""
 from __future__ import annotations
 
+import io
 import logging
+import posixpath
+import zipfile
 from pathlib import Path
-
-from docx import Document
+from typing import IO, Iterator
+from xml.etree import ElementTree
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+_NAMESPACES = (
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "http://purl.oclc.org/ooxml/wordprocessingml/main",
+)
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_REL_TAG = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+)
+
+
+def _tags(local_name: str) -> frozenset[str]:
+    return frozenset(f"{{{namespace}}}{local_name}" for namespace in _NAMESPACES)
+
+
+_PARAGRAPH = _tags("p")
+_TEXT = _tags("t")
+_TABS = _tags("tab") | _tags("ptab")
+_BREAK = _tags("br")
+_CARRIAGE_RETURN = _tags("cr")
+_NO_BREAK_HYPHEN = _tags("noBreakHyphen")
+_BREAK_TYPES = {f"{{{namespace}}}type" for namespace in _NAMESPACES}
+
+# Relationship types of the parts read after the main document, in order.
+_RELATED_PARTS = ("/header", "/footer", "/footnotes", "/endnotes")
+_OFFICE_DOCUMENT = "/officeDocument"
+_DEFAULT_MAIN_PART = "word/document.xml"
+
+
+def _iter_part_paragraphs(part: IO[bytes]) -> Iterator[str]:
+    """Yield paragraph texts of one WordprocessingML part while parsing it.
+
+    Paragraphs in tables, text boxes and other nested content are included.
+    A paragraph nested inside another (text box content) is yielded before
+    its host. ``mc:Fallback`` content is skipped since it duplicates the
+    preferred ``mc:Choice`` rendering.
+    """
+    stack: list[list[str]] = []
+    skipping = 0
+    depth = 0
+    # Second-level element (``w:body`` in the main document); its consumed
+    # children are dropped so the parsed tree never grows.
+    container = None
+    for event, elem in ElementTree.iterparse(part, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            depth += 1
+            if depth == 2:
+                container = elem
+            if tag == _MC_FALLBACK:
+                skipping += 1
+            elif tag in _PARAGRAPH and not skipping:
+                stack.append([])
+            continue
+
+        depth -= 1
+        if tag == _MC_FALLBACK:
+            skipping -= 1
+        elif skipping or not stack:
+            pass
+        elif tag in _TEXT:
+            stack[-1].append(elem.text or "")
+        elif tag in _TABS:
+            stack[-1].append("\t")
+        elif tag in _BREAK:
+            break_type = next(
+                (elem.get(name) for name in _BREAK_TYPES if name in elem.attrib),
+                "textWrapping",
+            )
+            if break_type == "textWrapping":
+                stack[-1].append("\n")
+        elif tag in _CARRIAGE_RETURN:
+            stack[-1].append("\n")
+        elif tag in _NO_BREAK_HYPHEN:
+            stack[-1].append("-")
+        elif tag in _PARAGRAPH:
+            yield "".join(stack.pop())
+
+        if depth == 2 and container is not None:
+            container.clear()
+
+
+def _part_names(archive: zipfile.ZipFile) -> list[str]:
+    """List the main document part, then its headers, footers and notes."""
+    names = set(archive.namelist())
+    main_part = _DEFAULT_MAIN_PART
+    for rel_type, target, _ in _relationships(archive, "_rels/.rels", names):
+        if rel_type.endswith(_OFFICE_DOCUMENT):
+            main_part = target.lstrip("/")
+            break
+
+    base = posixpath.dirname(main_part)
+    rels_name = posixpath.join(
+        base, "_rels", posixpath.basename(main_part) + ".rels"
+    )
+    related: dict[str, list[str]] = {suffix: [] for suffix in _RELATED_PARTS}
+    for rel_type, target, external in _relationships(archive, rels_name, names):
+        suffix = next((s for s in _RELATED_PARTS if rel_type.endswith(s)), None)
+        if suffix is None or external:
+            continue
+        if target.startswith("/"):
+            part = target.lstrip("/")
+        else:
+            part = posixpath.normpath(posixpath.join(base, target))
+        if part in names:
+            related[suffix].append(part)
+    return [main_part] + [
+        part for suffix in _RELATED_PARTS for part in related[suffix]
+    ]
+
+
+def _relationships(
+    archive: zipfile.ZipFile, rels_name: str, names: set[str]
+) -> list[tuple[str, str, bool]]:
+    """Return ``(type, target, is_external)`` for a relationships part."""
+    if rels_name not in names:
+        return []
+    root = ElementTree.fromstring(archive.read(rels_name))
+    return [
+        (
+            rel.get("Type", ""),
+            rel.get("Target", ""),
+            rel.get("TargetMode") == "External",
+        )
+        for rel in root.iter(_REL_TAG)
+    ]
+
+
+def _iter_archive_paragraphs(source: str | Path | IO[bytes]) -> Iterator[str]:
+    with zipfile.ZipFile(source) as archive:
+        for part_name in _part_names(archive):
+            with archive.open(part_name) as part:
+                yield from _iter_part_paragraphs(part)
+
+
 class DocxExtractor:
-    """Extract text from DOCX files."""
+    """Extract text from DOCX files.
+
+    The default ``"xml"`` engine streams the document, header, footer and
+    note parts out of the ZIP with an incremental XML parser, covering body
+    paragraphs, tables and text boxes. The ``"python-docx"`` engine builds the
+    python-docx object model and only reads body paragraphs; it is kept for
+    comparison (see ``benchmarks/docx_benchmark.py``).
+    """
+
+    VERSION = "2"
+    ENGINES = ("xml", "python-docx")
+    ENGINE = "xml"
+    CHUNK_SIZE = 64 * 1024
 
-    @staticmethod
-    def extract_text(file_path: str | Path) -> str:
+    @classmethod
+    def cache_token(cls) -> str:
+        """Return the version and the engine, which changes the output."""
+        return f"{cls.VERSION};engine={cls.ENGINE}"
+
+    @classmethod
+    def extract_text(cls, file_path: str | Path, engine: str | None = None) -> str:
         """Extract text from a DOCX file.
 
         Args:
             file_path: Path to the DOCX file.
+            engine: Extraction engine; defaults to ``ENGINE``.
 
         Returns:
             Extracted text.
         """
         path = Path(file_path)
         try:
-            document = Document(str(path))
-            text_parts = [paragraph.text for paragraph in document.paragraphs]
-            text = "\n".join(text_parts)
+            text = cls._extract(str(path), engine)
             LOGGER.info("Extracted text from DOCX: %s", path)
             return text
         except Exception as exc:  # noqa: BLE001
             LOGGER.error("Failed to extract DOCX %s: %s", path, exc)
             raise
+
+    @classmethod
+    def extract_bytes(cls, data: bytes, engine: str | None = None) -> str:
+        """Extract text from in-memory DOCX content.
+
+        Args:
+            data: DOCX file bytes.
+            engine: Extraction engine; defaults to ``ENGINE``.
+
+        Returns:
+            Extracted text.
+        """
+        try:
+            text = cls._extract(io.BytesIO(data), engine)
+            LOGGER.info("Extracted text from DOCX bytes")
+            return text
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.error("Failed to extract DOCX content: %s", exc)
+            raise
+
+    @classmethod
+    def iter_text(cls, file_path: str | Path) -> Iterator[str]:
+        """Yield the text of a DOCX file while its parts are being parsed.
+
+        Args:
+            file_path: Path to the DOCX file.
+
+        Yields:
+            Text chunks of about ``CHUNK_SIZE`` characters whose concatenation
+            equals ``extract_text`` with the ``"xml"`` engine.
+        """
+        path = Path(file_path)
+        batch: list[str] = []
+        size = 0
+        first = True
+        for paragraph in _iter_archive_paragraphs(str(path)):
+            batch.append(paragraph)
+            size += len(paragraph) + 1
+            if size >= cls.CHUNK_SIZE:
+                yield ("" if first else "\n") + "\n".join(batch)
+                first = False
+                batch = []
+                size = 0
+        if batch:
+            yield ("" if first else "\n") + "\n".join(batch)
+        LOGGER.info("Streamed text from DOCX: %s", path)
+
+    @classmethod
+    def _extract(cls, source: str | IO[bytes], engine: str | None) -> str:
+        engine = engine or cls.ENGINE
+        if engine == "xml":
+            return "\n".join(_iter_archive_paragraphs(source))
+        if engine == "python-docx":
+            from docx import Document
+
+            document = Document(source)
+            return "\n".join(paragraph.text for paragraph in document.paragraphs)
+        raise ValueError(f"Unknown DOCX extraction engine: {engine}")
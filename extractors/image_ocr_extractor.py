@@ -1,10 +1,15 @@
 """Image OCR extractor using pytesseract and Pillow."""
 from __future__ import annotations
 
+import io
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Iterable
 
-from PIL import Image
+from PIL import Image, ImageOps
 import pytesseract
 from pytesseract import TesseractNotFoundError
 
@@ -12,11 +17,173 @@ from pytesseract import TesseractNotFoundError
 LOGGER = logging.getLogger(__name__)
 
 
+_EXIF_ORIENTATION = 0x0112
+# EXIF orientations that rotate the image by a quarter turn, swapping width
+# and height.
+_QUARTER_TURNS = (5, 6, 7, 8)
+
+
+def _ocr_file(file_path: str) -> tuple[str, str | None]:
+    """OCR one image file in a worker process, returning errors as text."""
+    try:
+        return ImageOCRExtractor.extract_text(file_path), None
+    except Exception as exc:  # noqa: BLE001
+        return "", f"{type(exc).__name__}: {exc}"
+
+
+def _otsu_threshold(histogram: list[int]) -> int:
+    """Return the grey level that best separates a 256-bin histogram."""
+    total = sum(histogram)
+    weighted_total = sum(level * count for level, count in enumerate(histogram))
+    background = 0
+    weighted_background = 0
+    best_level, best_variance = 127, -1.0
+    for level, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        weighted_background += level * count
+        mean_background = weighted_background / background
+        mean_foreground = (weighted_total - weighted_background) / foreground
+        spread = mean_background - mean_foreground
+        variance = background * foreground * spread * spread
+        if variance > best_variance:
+            best_level, best_variance = level, variance
+    return best_level
+
+
 class ImageOCRExtractor:
-    """Extract text from images using OCR."""
+    """Extract text from images using OCR.
+
+    Images are preprocessed before recognition: EXIF rotation is applied,
+    the image is converted to grayscale, resized to ``TARGET_DPI`` (never
+    wider than ``MAX_WIDTH`` pixels) and binarized with Otsu's threshold.
+    JPEG photos that need strong downscaling are decoded at reduced size.
+    Images taller than ``TILE_HEIGHT`` after resizing are recognized in
+    horizontal strips cut along blank rows, which bounds Tesseract's memory.
+    """
+
+    VERSION = "2"
+    PSM = 3
+    TARGET_DPI = 300
+    MAX_UPSCALE = 2.0
+    # Width of a Letter page at 300 DPI.
+    MAX_WIDTH = 2550
+    BINARIZE = True
+    TILE_HEIGHT = 4000
+    TILE_SEARCH = 200
+    MAX_WORKERS: int | None = None
+
+    @classmethod
+    def cache_token(cls) -> str:
+        """Return the version and the settings that change the OCR output."""
+        return (
+            f"{cls.VERSION};psm={cls.PSM};dpi={cls.TARGET_DPI};"
+            f"upscale={cls.MAX_UPSCALE};width={cls.MAX_WIDTH};"
+            f"binarize={cls.BINARIZE};tiles={cls.TILE_HEIGHT}/{cls.TILE_SEARCH}"
+        )
+
+    @classmethod
+    def ocr_image(cls, image: Image.Image, psm: int | None = None) -> str:
+        """Run OCR on an already opened image.
+
+        Args:
+            image: Pillow image.
+            psm: Tesseract page segmentation mode; defaults to ``PSM``.
+
+        Returns:
+            Recognized text.
+        """
+        prepared = cls.preprocess(image)
+        psm = cls.PSM if psm is None else psm
+        config = f"--psm {psm} --dpi {cls.TARGET_DPI}"
+        bounds = cls._tile_bounds(prepared)
+        if len(bounds) == 1:
+            return pytesseract.image_to_string(prepared, config=config)
+        LOGGER.info("OCR of %dpx tall image in %d strips", prepared.height, len(bounds))
+        return "\n".join(
+            pytesseract.image_to_string(
+                prepared.crop((0, top, prepared.width, bottom)), config=config
+            )
+            for top, bottom in bounds
+        )
+
+    @classmethod
+    def preprocess(cls, image: Image.Image) -> Image.Image:
+        """Normalize orientation, color, resolution and contrast for OCR.
+
+        Args:
+            image: Pillow image.
+
+        Returns:
+            Grayscale (binarized when ``BINARIZE`` is set) image.
+        """
+        scale = cls._scale_factor(image)
+        if image.format == "JPEG":
+            # Decode straight to grayscale, at 1/2, 1/4 or 1/8 size if possible.
+            full_width = image.width
+            image.draft("L", (round(image.width * scale), round(image.height * scale)))
+            scale *= full_width / image.width
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "P") and (
+            image.mode != "P" or "transparency" in image.info
+        ):
+            image = image.convert("RGBA")
+            background = Image.new("RGBA", image.size, "white")
+            image = Image.alpha_composite(background, image)
+        image = image.convert("L")
+        if abs(scale - 1.0) > 0.05:
+            width = max(1, round(image.width * scale))
+            height = max(1, round(image.height * scale))
+            # Area averaging is cheap and keeps strokes intact when shrinking.
+            resample = (
+                Image.Resampling.BOX if scale < 1.0 else Image.Resampling.BICUBIC
+            )
+            image = image.resize((width, height), resample)
+        if cls.BINARIZE:
+            threshold = _otsu_threshold(image.histogram())
+            image = image.point(
+                [0 if level <= threshold else 255 for level in range(256)]
+            )
+        return image
+
+    @classmethod
+    def _scale_factor(cls, image: Image.Image) -> float:
+        """Resize factor bringing an image to ``TARGET_DPI`` within limits."""
+        scale = 1.0
+        dpi = image.info.get("dpi")
+        if dpi and float(dpi[0]) > 0:
+            scale = min(cls.TARGET_DPI / float(dpi[0]), cls.MAX_UPSCALE)
+        # MAX_WIDTH applies to the upright image, after EXIF rotation.
+        rotated = image.getexif().get(_EXIF_ORIENTATION) in _QUARTER_TURNS
+        width = (image.height if rotated else image.width) * scale
+        if width > cls.MAX_WIDTH:
+            scale *= cls.MAX_WIDTH / width
+        return scale
 
-    @staticmethod
-    def extract_text(file_path: str | Path) -> str:
+    @classmethod
+    def _tile_bounds(cls, image: Image.Image) -> list[tuple[int, int]]:
+        """Split an image into horizontal strips, cutting at blank rows."""
+        height = image.height
+        bounds: list[tuple[int, int]] = []
+        top = 0
+        while height - top > cls.TILE_HEIGHT:
+            cut = top + cls.TILE_HEIGHT
+            for row in range(cut, max(cut - cls.TILE_SEARCH, top + 1), -1):
+                low, _ = image.crop((0, row - 1, image.width, row)).getextrema()
+                if low == 255:
+                    cut = row
+                    break
+            bounds.append((top, cut))
+            top = cut
+        bounds.append((top, height))
+        return bounds
+
+    @classmethod
+    def extract_text(cls, file_path: str | Path) -> str:
         """Extract text from an image file using OCR.
 
         Args:
@@ -28,7 +195,7 @@ class ImageOCRExtractor:
         path = Path(file_path)
         try:
             with Image.open(path) as image:
-                text = pytesseract.image_to_string(image)
+                text = cls.ocr_image(image)
             LOGGER.info("Extracted text from image via OCR: %s", path)
             return text
         except TesseractNotFoundError as exc:
@@ -37,3 +204,62 @@ class ImageOCRExtractor:
         except Exception as exc:  # noqa: BLE001
             LOGGER.error("Failed OCR extraction for %s: %s", path, exc)
             raise
+
+    @classmethod
+    def extract_bytes(cls, data: bytes) -> str:
+        """Extract text from in-memory image content using OCR.
+
+        Args:
+            data: Image file bytes.
+
+        Returns:
+            Extracted text.
+        """
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                text = cls.ocr_image(image)
+            LOGGER.info("Extracted text from image bytes via OCR")
+            return text
+        except TesseractNotFoundError as exc:
+            LOGGER.error("Tesseract OCR not found: %s", exc)
+            raise
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.error("Failed OCR extraction for image content: %s", exc)
+            raise
+
+    @classmethod
+    def extract_many(
+        cls, file_paths: Iterable[str | Path], max_workers: int | None = None
+    ) -> list[str]:
+        """OCR several image files, in a process pool when there are several.
+
+        Args:
+            file_paths: Paths to the image files.
+            max_workers: Optional override of ``MAX_WORKERS`` (``None`` uses
+                the CPU count, ``1`` disables the pool).
+
+        Returns:
+            Extracted texts in input order; failed images give empty text
+            and are logged.
+        """
+        paths = [str(path) for path in file_paths]
+        workers = max_workers or cls.MAX_WORKERS or os.cpu_count() or 1
+        workers = max(1, min(workers, len(paths)))
+        results: list[tuple[str, str | None]] | None = None
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_ocr_file, paths))
+            except (BrokenProcessPool, OSError) as exc:
+                LOGGER.warning(
+                    "OCR process pool unavailable, running serially: %s", exc
+                )
+        if results is None:
+            results = [_ocr_file(path) for path in paths]
+
+        texts: list[str] = []
+        for path, (text, error) in zip(paths, results):
+            if error is not None:
+                LOGGER.warning("OCR failed for %s: %s", path, error)
+            texts.append(text)
+        return texts
@@ -1,33 +1,181 @@
-"""JSON file extractor."""
+"""JSON and JSON Lines file extractors."""
 from __future__ import annotations
 
 import json
 import logging
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, TextIO
+
+import regex as re
 
 
 LOGGER = logging.getLogger(__name__)
 
 
-def _flatten_json(data: Any) -> list[str]:
-    """Recursively flatten JSON content into a list of string fragments."""
-    fragments: list[str] = []
-    if isinstance(data, dict):
-        for key, value in data.items():
-            fragments.append(str(key))
-            fragments.extend(_flatten_json(value))
-    elif isinstance(data, list):
-        for item in data:
-            fragments.extend(_flatten_json(item))
-    else:
-        fragments.append(str(data))
-    return fragments
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_TOKEN_PATTERN = re.compile(
+    r"""(?:
+        (?P<string>"[^"\\\x00-\x1f]*(?:\\.[^"\\\x00-\x1f]*)*")
+      | (?P<number>-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?(?![\d.eE+\-]))
+      | (?P<literal>true|false|null)
+      | (?P<constant>NaN|-?Infinity)
+      | (?P<punct>[{}\[\]:,])
+    )""",
+    re.VERBOSE,
+)
+# Longest text that may still grow into a token once more input is read: an
+# unterminated string, a number or a short run of letters.
+_PARTIAL_PATTERN = re.compile(
+    r"""(?:
+        "(?:[^"\\\x00-\x1f]|\\.)*\\?
+      | -?[a-zA-Z]{1,8}
+      | -?[\d.eE+\-]+
+    )""",
+    re.VERBOSE,
+)
+_LITERALS = {"true": "True", "false": "False", "null": "None"}
+_CLOSING = {"}": "{", "]": "["}
+
+# Grammar states of the streaming tokenizer: what may come next.
+_VALUE = "value"
+_FIRST_ITEM = "value or ']'"
+_FIRST_KEY = "property name or '}'"
+_KEY = "property name"
+_COLON = "':' delimiter"
+_NEXT = "',' delimiter or closing bracket"
+_DONE = "end of document"
+
+
+def _iter_fragments(data: Any) -> Iterator[str]:
+    """Yield the string fragments of parsed JSON content in document order.
+
+    Object keys precede their values. An explicit stack of iterators is used
+    instead of recursion, so deeply nested documents neither hit the
+    recursion limit nor copy fragment lists at every level.
+    """
+    stack: list[Iterator[Any]] = [iter((data,))]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, dict):
+                stack.append(chain.from_iterable(item.items()))
+                break
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
+            yield str(item)
+        else:
+            stack.pop()
+
+
+def _iter_stream_fragments(
+    handle: TextIO, chunk_size: int, label: str | Path
+) -> Iterator[str]:
+    """Yield the fragments of a JSON document read incrementally.
+
+    Scalars are tokenized straight from the text without building the
+    document tree, so memory is bounded by ``chunk_size`` and the longest
+    single token. The expected next token is tracked, so documents that
+    ``json.load`` rejects raise here too, as soon as the offending token is
+    reached. Fragments match ``_iter_fragments`` on the parsed document,
+    except that repeated keys within one object are all kept.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    buffer = ""
+    pos = 0
+    eof = False
+    open_brackets: list[str] = []
+    state = _VALUE
+
+    def error(message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(f"{message} in {label}", buffer, pos)
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        match = _TOKEN_PATTERN.match(buffer, pos)
+        if pos == len(buffer) or match is None or (
+            match.end() == len(buffer) and not eof
+        ):
+            if eof:
+                if pos == len(buffer):
+                    break
+                raise error("Invalid JSON token")
+            partial = _PARTIAL_PATTERN.match(buffer, pos)
+            if pos < len(buffer) and (
+                partial is None or partial.end() < len(buffer)
+            ):
+                # More input cannot complete a token here.
+                if match is None:
+                    raise error("Invalid JSON token")
+            else:
+                buffer = buffer[pos:]
+                pos = 0
+                chunk = handle.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+
+        if state == _DONE:
+            raise error("Extra data")
+        kind = match.lastgroup
+        token = match.group(kind)
+        if kind == "punct":
+            if token in "{[":
+                if state not in (_VALUE, _FIRST_ITEM):
+                    raise error(f"Expecting {state}")
+                open_brackets.append(token)
+                state = _FIRST_KEY if token == "{" else _FIRST_ITEM
+            elif token in _CLOSING:
+                closes_empty = (state, token) in (
+                    (_FIRST_KEY, "}"),
+                    (_FIRST_ITEM, "]"),
+                )
+                if not (state == _NEXT or closes_empty) or (
+                    open_brackets[-1] != _CLOSING[token]
+                ):
+                    raise error(f"Expecting {state}")
+                open_brackets.pop()
+                state = _NEXT if open_brackets else _DONE
+            elif token == ":":
+                if state != _COLON:
+                    raise error(f"Expecting {state}")
+                state = _VALUE
+            else:
+                if state != _NEXT:
+                    raise error(f"Expecting {state}")
+                state = _KEY if open_brackets[-1] == "{" else _VALUE
+            pos = match.end()
+            continue
+
+        if state in (_KEY, _FIRST_KEY):
+            if kind != "string":
+                raise error(f"Expecting {state}")
+            state = _COLON
+        elif state in (_VALUE, _FIRST_ITEM):
+            state = _NEXT if open_brackets else _DONE
+        else:
+            raise error(f"Expecting {state}")
+        pos = match.end()
+        if kind == "string":
+            yield json.loads(token) if "\\" in token else token[1:-1]
+        elif kind == "literal":
+            yield _LITERALS[token]
+        else:
+            yield str(json.loads(token))
+
+    if state != _DONE:
+        raise error("Incomplete JSON document")
 
 
 class JsonExtractor:
     """Extract text from JSON files."""
 
+    VERSION = "1"
+    CHUNK_SIZE = 1024 * 1024
+    FRAGMENTS_PER_CHUNK = 4096
+
     @staticmethod
     def extract_text(file_path: str | Path) -> str:
         """Extract text from a JSON file.
@@ -42,8 +190,7 @@ class JsonExtractor:
         try:
             with path.open("r", encoding="utf-8") as handle:
                 data = json.load(handle)
-            flattened = _flatten_json(data)
-            text = " ".join(flattened)
+            text = " ".join(_iter_fragments(data))
             LOGGER.info("Extracted text from JSON: %s", path)
             return text
         except json.JSONDecodeError as exc:
@@ -52,3 +199,146 @@ class JsonExtractor:
         except OSError as exc:
             LOGGER.error("Failed to read JSON %s: %s", path, exc)
             raise
+
+    @staticmethod
+    def extract_bytes(data: bytes) -> str:
+        """Extract text from in-memory JSON content.
+
+        Args:
+            data: JSON file bytes.
+
+        Returns:
+            Extracted text.
+        """
+        try:
+            text = " ".join(_iter_fragments(json.loads(data)))
+            LOGGER.info("Extracted text from JSON bytes")
+            return text
+        except json.JSONDecodeError as exc:
+            LOGGER.error("Invalid JSON content: %s", exc)
+            raise
+
+    @classmethod
+    def iter_text(cls, file_path: str | Path) -> Iterator[str]:
+        """Yield the text of a large JSON file without loading it whole.
+
+        Args:
+            file_path: Path to the JSON file.
+
+        Yields:
+            Text chunks whose concatenation equals ``extract_text`` (repeated
+            object keys aside).
+        """
+        path = Path(file_path)
+        with path.open("r", encoding="utf-8") as handle:
+            fragments = _iter_stream_fragments(handle, cls.CHUNK_SIZE, path)
+            yield from _join_in_chunks(fragments, cls.FRAGMENTS_PER_CHUNK)
+        LOGGER.info("Streamed text from JSON: %s", path)
+
+
+class JsonlExtractor:
+    """Extract text from JSON Lines files, one record per line.
+
+    ``iter_records`` exposes each record separately so that batch processing
+    can analyze every line as its own resume. Extracting the whole file as
+    one document joins the record texts with newlines.
+    """
+
+    VERSION = "1"
+
+    @staticmethod
+    def iter_records(file_path: str | Path) -> Iterator[tuple[int, str]]:
+        """Yield the non-blank lines of a JSON Lines file.
+
+        Lines are returned unparsed so that parsing can happen in worker
+        processes.
+
+        Args:
+            file_path: Path to the JSONL file.
+
+        Yields:
+            Tuples of 1-based line number and raw line.
+        """
+        path = Path(file_path)
+        with path.open("r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if line.strip():
+                    yield line_number, line
+
+    @staticmethod
+    def record_text(line: str) -> str:
+        """Extract text from one JSON Lines record.
+
+        Args:
+            line: Raw JSON line.
+
+        Returns:
+            Extracted text.
+
+        Raises:
+            json.JSONDecodeError: If the line is not valid JSON.
+        """
+        return " ".join(_iter_fragments(json.loads(line)))
+
+    @classmethod
+    def iter_text(cls, file_path: str | Path) -> Iterator[str]:
+        """Yield the text of a JSON Lines file record by record.
+
+        Args:
+            file_path: Path to the JSONL file.
+
+        Yields:
+            Record texts, each after the first prefixed with a newline.
+        """
+        for index, (_, line) in enumerate(cls.iter_records(file_path)):
+            text = cls.record_text(line)
+            yield text if index == 0 else "\n" + text
+
+    @classmethod
+    def extract_text(cls, file_path: str | Path) -> str:
+        """Extract the text of all records of a JSON Lines file.
+
+        Args:
+            file_path: Path to the JSONL file.
+
+        Returns:
+            Record texts joined with newlines.
+        """
+        path = Path(file_path)
+        try:
+            text = "".join(cls.iter_text(path))
+            LOGGER.info("Extracted text from JSONL: %s", path)
+            return text
+        except json.JSONDecodeError as exc:
+            LOGGER.error("Invalid JSON record in %s: %s", path, exc)
+            raise
+
+    @classmethod
+    def extract_bytes(cls, data: bytes) -> str:
+        """Extract the text of all records of in-memory JSON Lines content.
+
+        Args:
+            data: JSONL file bytes.
+
+        Returns:
+            Record texts joined with newlines.
+        """
+        text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        lines = text.split("\n")
+        text = "\n".join(cls.record_text(line) for line in lines if line.strip())
+        LOGGER.info("Extracted text from JSONL bytes")
+        return text
+
+
+def _join_in_chunks(fragments: Iterator[str], per_chunk: int) -> Iterator[str]:
+    """Join fragments with spaces, yielding ``per_chunk`` fragments at a time."""
+    batch: list[str] = []
+    first = True
+    for fragment in fragments:
+        batch.append(fragment)
+        if len(batch) == per_chunk:
+            yield ("" if first else " ") + " ".join(batch)
+            first = False
+            batch = []
+    if batch:
+        yield ("" if first else " ") + " ".join(batch)
@@ -1,38 +1,308 @@
 """PDF file extractor using PyPDF2."""
 from __future__ import annotations
 
+import io
 import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Iterator
 
-from PyPDF2 import PdfReader
+from PyPDF2 import PageObject, PdfReader
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+PdfSource = str | bytes
+
+
+def _open_reader(source: PdfSource) -> PdfReader:
+    """Open a PDF from a path or from in-memory bytes."""
+    if isinstance(source, bytes):
+        return PdfReader(io.BytesIO(source))
+    return PdfReader(source)
+
+
+def _extract_page_range(source: PdfSource, start: int, stop: int) -> list[str]:
+    """Extract text from pages ``start``..``stop - 1`` in a worker process."""
+    reader = _open_reader(source)
+    return [reader.pages[idx].extract_text() or "" for idx in range(start, stop)]
+
+
+def _page_images(page: PageObject) -> list[bytes]:
+    """Return the encoded data of the images embedded in a page."""
+    return [image_file.data for image_file in page.images]
+
+
+def _ocr_images(images: list[bytes]) -> tuple[str, str | None]:
+    """OCR encoded page images, possibly in a worker process.
+
+    Errors are returned as text rather than raised, since OCR exceptions
+    such as ``TesseractNotFoundError`` do not survive the trip back from a
+    worker process.
+    """
+    from PIL import Image
+
+    from resume_profiling.extractors.image_ocr_extractor import ImageOCRExtractor
+
+    try:
+        texts = []
+        for data in images:
+            with Image.open(io.BytesIO(data)) as image:
+                texts.append(ImageOCRExtractor.ocr_image(image))
+        return "\n".join(texts), None
+    except Exception as exc:  # noqa: BLE001
+        return "", f"{type(exc).__name__}: {exc}"
+
+
+def _ocr_page_images(page: PageObject) -> tuple[str, str | None]:
+    """OCR the embedded images of a page in the current process."""
+    try:
+        images = _page_images(page)
+    except Exception as exc:  # noqa: BLE001
+        return "", f"{type(exc).__name__}: {exc}"
+    return _ocr_images(images)
+
+
 class PdfExtractor:
-    """Extract text from PDF files."""
+    """Extract text from PDF files.
 
-    @staticmethod
-    def extract_text(file_path: str | Path) -> str:
+    Documents with at least ``PARALLEL_PAGE_THRESHOLD`` pages are split into
+    contiguous page ranges extracted in a process pool of ``MAX_WORKERS``
+    workers (``None`` uses the CPU count, ``1`` disables the pool). Ranges
+    are reassembled in page order.
+
+    Pages without a text layer but with embedded images, as produced by
+    scanners, are OCR'd through ``ImageOCRExtractor`` when ``OCR_EMPTY_PAGES``
+    is set. Only those pages are OCR'd, in parallel when there are several.
+    """
+
+    VERSION = "2"
+    PARALLEL_PAGE_THRESHOLD = 30
+    MAX_WORKERS: int | None = None
+    OCR_EMPTY_PAGES = True
+
+    @classmethod
+    def cache_token(cls) -> str:
+        """Return the version and the settings that change the output."""
+        if not cls.OCR_EMPTY_PAGES:
+            return f"{cls.VERSION};ocr=off"
+        from resume_profiling.extractors.image_ocr_extractor import ImageOCRExtractor
+
+        return f"{cls.VERSION};ocr={ImageOCRExtractor.cache_token()}"
+
+    @classmethod
+    def extract_text(
+        cls, file_path: str | Path, max_workers: int | None = None
+    ) -> str:
         """Extract text from a PDF file.
 
         Args:
             file_path: Path to the PDF file.
+            max_workers: Optional override of ``MAX_WORKERS``.
 
         Returns:
             Extracted text.
         """
         path = Path(file_path)
         try:
-            reader = PdfReader(str(path))
-            text_parts: list[str] = []
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                text_parts.append(page_text)
-            text = "\n".join(text_parts)
+            text = cls._extract(str(path), path, max_workers)
             LOGGER.info("Extracted text from PDF: %s", path)
             return text
         except Exception as exc:  # noqa: BLE001
             LOGGER.error("Failed to extract PDF %s: %s", path, exc)
             raise
+
+    @classmethod
+    def extract_bytes(cls, data: bytes, max_workers: int | None = None) -> str:
+        """Extract text from in-memory PDF content.
+
+        Args:
+            data: PDF file bytes.
+            max_workers: Optional override of ``MAX_WORKERS``.
+
+        Returns:
+            Extracted text.
+        """
+        try:
+            text = cls._extract(data, "<bytes>", max_workers)
+            LOGGER.info("Extracted text from PDF bytes")
+            return text
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.error("Failed to extract PDF content: %s", exc)
+            raise
+
+    @classmethod
+    def iter_text(cls, file_path: str | Path) -> Iterator[str]:
+        """Yield the text of a PDF file page by page.
+
+        Pages are extracted serially so that only one page of text is held
+        at a time; image-only pages are OCR'd inline. The concatenated chunks
+        equal ``extract_text``.
+
+        Args:
+            file_path: Path to the PDF file.
+
+        Yields:
+            Page texts, each after the first prefixed with a newline.
+        """
+        path = Path(file_path)
+        reader = _open_reader(str(path))
+        for idx, page in enumerate(reader.pages):
+            page_text = page.extract_text() or ""
+            if (
+                cls.OCR_EMPTY_PAGES
+                and not page_text.strip()
+                and cls._has_images(page)
+            ):
+                page_text, error = _ocr_page_images(page)
+                if error is not None:
+                    LOGGER.warning(
+                        "OCR failed for page %d of %s: %s", idx + 1, path, error
+                    )
+            yield page_text if idx == 0 else "\n" + page_text
+        LOGGER.info("Streamed text from PDF: %s", path)
+
+    @classmethod
+    def _extract(
+        cls, source: PdfSource, label: str | Path, max_workers: int | None
+    ) -> str:
+        reader = _open_reader(source)
+        page_count = len(reader.pages)
+        workers = cls._worker_count(page_count, max_workers)
+        if workers > 1:
+            text_parts = cls._extract_parallel(source, label, page_count, workers)
+        else:
+            text_parts = [page.extract_text() or "" for page in reader.pages]
+
+        if cls.OCR_EMPTY_PAGES:
+            scanned = [
+                idx
+                for idx, page_text in enumerate(text_parts)
+                if not page_text.strip() and cls._has_images(reader.pages[idx])
+            ]
+            if scanned:
+                ocr_texts = cls._ocr_pages(reader, label, scanned, max_workers)
+                for idx, page_text in zip(scanned, ocr_texts):
+                    text_parts[idx] = page_text
+
+        return "\n".join(text_parts)
+
+    @classmethod
+    def _worker_count(cls, page_count: int, max_workers: int | None) -> int:
+        if page_count < cls.PARALLEL_PAGE_THRESHOLD:
+            return 1
+        workers = max_workers or cls.MAX_WORKERS or os.cpu_count() or 1
+        return max(1, min(workers, page_count))
+
+    @staticmethod
+    def _has_images(page: PageObject) -> bool:
+        """Return True when a page references at least one image XObject."""
+        resources = page.get("/Resources")
+        if resources is None:
+            return False
+        xobjects = resources.get_object().get("/XObject")
+        if xobjects is None:
+            return False
+        xobjects = xobjects.get_object()
+        return any(
+            xobjects[name].get_object().get("/Subtype") == "/Image"
+            for name in xobjects
+        )
+
+    @staticmethod
+    def _extract_parallel(
+        source: PdfSource, label: str | Path, page_count: int, workers: int
+    ) -> list[str]:
+        """Extract contiguous page ranges in a process pool, keeping order."""
+        chunk_size = -(-page_count // workers)
+        ranges = [
+            (start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+        LOGGER.info(
+            "Extracting %d PDF pages with %d workers: %s",
+            page_count,
+            len(ranges),
+            label,
+        )
+        try:
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                chunks = pool.map(
+                    _extract_page_range,
+                    [source] * len(ranges),
+                    [start for start, _ in ranges],
+                    [stop for _, stop in ranges],
+                )
+                return [text for chunk in chunks for text in chunk]
+        except (BrokenProcessPool, OSError) as exc:
+            LOGGER.warning("PDF process pool unavailable, extracting serially: %s", exc)
+            return _extract_page_range(source, 0, page_count)
+
+    @classmethod
+    def _ocr_pages(
+        cls,
+        reader: PdfReader,
+        label: str | Path,
+        page_indices: list[int],
+        max_workers: int | None,
+    ) -> list[str]:
+        """OCR the given pages, in a process pool when there are several.
+
+        Page images are read here and only their bytes go to the workers,
+        so the document is neither sent nor parsed again per page. At most
+        two pages per worker are in flight.
+        """
+        workers = max_workers or cls.MAX_WORKERS or os.cpu_count() or 1
+        workers = max(1, min(workers, len(page_indices)))
+        LOGGER.info(
+            "OCR of %d image-only PDF pages with %d workers: %s",
+            len(page_indices),
+            workers,
+            label,
+        )
+        results: list[tuple[str, str | None]] | None = None
+        if workers > 1:
+            try:
+                results = cls._ocr_parallel(reader, page_indices, workers)
+            except (BrokenProcessPool, OSError) as exc:
+                LOGGER.warning(
+                    "OCR process pool unavailable, running serially: %s", exc
+                )
+        if results is None:
+            results = [_ocr_page_images(reader.pages[idx]) for idx in page_indices]
+
+        texts: list[str] = []
+        for idx, (page_text, error) in zip(page_indices, results):
+            if error is not None:
+                LOGGER.warning(
+                    "OCR failed for page %d of %s: %s", idx + 1, label, error
+                )
+            texts.append(page_text)
+        return texts
+
+    @staticmethod
+    def _ocr_parallel(
+        reader: PdfReader, page_indices: list[int], workers: int
+    ) -> list[tuple[str, str | None]]:
+        """OCR pages in a process pool, keeping page order."""
+        results: list[tuple[str, str | None]] = []
+        pending: deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for idx in page_indices:
+                try:
+                    images = _page_images(reader.pages[idx])
+                except Exception as exc:  # noqa: BLE001
+                    future: Future = Future()
+                    future.set_result(("", f"{type(exc).__name__}: {exc}"))
+                else:
+                    future = pool.submit(_ocr_images, images)
+                pending.append(future)
+                if len(pending) >= 2 * workers:
+                    results.append(pending.popleft().result())
+            while pending:
+                results.append(pending.popleft().result())
+        return results
@@ -1,8 +1,10 @@
 """TXT file extractor."""
 from __future__ import annotations
 
+import codecs
 import logging
 from pathlib import Path
+from typing import Iterator
 
 
 LOGGER = logging.getLogger(__name__)
@@ -11,6 +13,9 @@ LOGGER = logging.getLogger(__name__)
 class TxtExtractor:
     """Extract text from TXT files."""
 
+    VERSION = "1"
+    CHUNK_SIZE = 1024 * 1024
+
     @staticmethod
     def extract_text(file_path: str | Path) -> str:
         """Extract text from a TXT file.
@@ -33,3 +38,56 @@ class TxtExtractor:
         except OSError as exc:
             LOGGER.error("Failed to read TXT %s: %s", path, exc)
             raise
+
+    @staticmethod
+    def extract_bytes(data: bytes) -> str:
+        """Extract text from in-memory TXT content.
+
+        Args:
+            data: TXT file bytes.
+
+        Returns:
+            Extracted text with newlines normalized as in ``extract_text``.
+        """
+        try:
+            text = data.decode("utf-8")
+            LOGGER.info("Extracted text from TXT bytes")
+        except UnicodeDecodeError:
+            text = data.decode("latin-1", errors="ignore")
+            LOGGER.warning("Fallback decoding used for TXT bytes")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    @classmethod
+    def iter_text(cls, file_path: str | Path) -> Iterator[str]:
+        """Yield the text of a TXT file in chunks of ``CHUNK_SIZE`` characters.
+
+        The decoding matches ``extract_text``: a first pass checks whether the
+        whole file is valid UTF-8, falling back to latin-1 otherwise.
+
+        Args:
+            file_path: Path to the TXT file.
+
+        Yields:
+            Consecutive text chunks.
+        """
+        path = Path(file_path)
+        if cls._is_utf8(path):
+            encoding, errors = "utf-8", "strict"
+        else:
+            encoding, errors = "latin-1", "ignore"
+            LOGGER.warning("Fallback decoding used for TXT: %s", path)
+        with path.open("r", encoding=encoding, errors=errors) as handle:
+            yield from iter(lambda: handle.read(cls.CHUNK_SIZE), "")
+        LOGGER.info("Streamed text from TXT: %s", path)
+
+    @classmethod
+    def _is_utf8(cls, path: Path) -> bool:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            with path.open("rb") as handle:
+                for block in iter(lambda: handle.read(cls.CHUNK_SIZE), b""):
+                    decoder.decode(block)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return False
+        return True
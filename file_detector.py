@@ -1,7 +1,10 @@
 """File type detection utilities."""
 from __future__ import annotations
 
+import codecs
+import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 
 
@@ -12,18 +15,34 @@ class UnsupportedFileTypeError(ValueError):
     """Raised when a file type is not supported."""
 
 
+@dataclass(frozen=True)
+class DetectedFile:
+    """Detection outcome for a file on disk.
+
+    ``header`` holds the bytes read for sniffing. When ``complete`` is True
+    the header is the whole file, so it can be extracted from memory without
+    opening the file again.
+    """
+
+    file_type: str
+    header: bytes
+    complete: bool
+
+
 class FileDetector:
-    """Detect supported file types based on file extension."""
+    """Detect supported file types from content, falling back to extension."""
 
     SUPPORTED_EXTENSIONS = {
         ".txt": "txt",
         ".pdf": "pdf",
         ".docx": "docx",
         ".json": "json",
+        ".jsonl": "jsonl",
         ".png": "image",
         ".jpg": "image",
         ".jpeg": "image",
     }
+    HEADER_SIZE = 64 * 1024
 
     @classmethod
     def detect(cls, file_path: str | Path) -> str:
@@ -35,20 +54,130 @@ class FileDetector:
         Returns:
             A string representing the detected file type.
 
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            UnsupportedFileTypeError: If the file type is unsupported.
+        """
+        return cls.detect_file(file_path).file_type
+
+    @classmethod
+    def detect_file(cls, file_path: str | Path) -> DetectedFile:
+        """Detect the file type from a single header read.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            DetectedFile with the type and the header bytes read.
+
         Raises:
             FileNotFoundError: If the file does not exist.
             UnsupportedFileTypeError: If the file type is unsupported.
         """
         path = Path(file_path)
-        if not path.exists():
+        try:
+            with path.open("rb") as handle:
+                header = handle.read(cls.HEADER_SIZE + 1)
+        except FileNotFoundError:
             LOGGER.error("File not found: %s", path)
-            raise FileNotFoundError(f"File not found: {path}")
-
-        ext = path.suffix.lower()
-        file_type = cls.SUPPORTED_EXTENSIONS.get(ext)
-        if not file_type:
-            LOGGER.error("Unsupported file type: %s", ext)
-            raise UnsupportedFileTypeError(f"Unsupported file type: {ext}")
+            raise FileNotFoundError(f"File not found: {path}") from None
 
+        complete = len(header) <= cls.HEADER_SIZE
+        header = header[: cls.HEADER_SIZE]
+        file_type = cls._resolve(header, complete, path.suffix.lower())
         LOGGER.info("Detected file type '%s' for %s", file_type, path)
+        return DetectedFile(file_type=file_type, header=header, complete=complete)
+
+    @classmethod
+    def detect_bytes(cls, data: bytes, filename: str | None = None) -> str:
+        """Detect the file type of in-memory content.
+
+        Args:
+            data: Document bytes.
+            filename: Optional original file name used as a fallback hint.
+
+        Returns:
+            A string representing the detected file type.
+
+        Raises:
+            UnsupportedFileTypeError: If the file type is unsupported.
+        """
+        ext = Path(filename).suffix.lower() if filename else ""
+        complete = len(data) <= cls.HEADER_SIZE
+        file_type = cls._resolve(data[: cls.HEADER_SIZE], complete, ext)
+        LOGGER.info("Detected file type '%s' for %s", file_type, filename)
         return file_type
+
+    @classmethod
+    def _resolve(cls, header: bytes, complete: bool, ext: str) -> str:
+        """Prefer the sniffed type, fall back to the extension."""
+        sniffed = cls.sniff(header, complete, ext)
+        by_extension = cls.SUPPORTED_EXTENSIONS.get(ext)
+        if sniffed:
+            if by_extension and sniffed != by_extension:
+                LOGGER.warning(
+                    "Content looks like '%s' despite '%s' extension", sniffed, ext
+                )
+            return sniffed
+        if not by_extension:
+            LOGGER.error("Unsupported file type: %s", ext or "<unknown>")
+            raise UnsupportedFileTypeError(f"Unsupported file type: {ext}")
+        return by_extension
+
+    @classmethod
+    def sniff(
+        cls, header: bytes, complete: bool = False, ext: str = ""
+    ) -> str | None:
+        """Guess a file type from leading content bytes.
+
+        Args:
+            header: Leading bytes of the document.
+            complete: Whether ``header`` is the whole document.
+            ext: Lowercase extension, used to settle JSON, JSON Lines and
+                TXT when the header alone is ambiguous.
+
+        Returns:
+            Detected file type, or None when the content is not recognized.
+        """
+        if not header:
+            return None
+        if b"%PDF-" in header[:1024]:
+            return "pdf"
+        if header.startswith((b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff")):
+            return "image"
+        if header.startswith(b"PK\x03\x04"):
+            return "docx" if b"word/" in header else None
+        if b"\x00" in header:
+            return None
+
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        try:
+            text = decoder.decode(header, final=complete)
+        except UnicodeDecodeError:
+            # Binary or legacy-encoded content: only a .txt file is taken
+            # as text, anything else is left to the extension check.
+            return "txt" if ext == ".txt" else None
+        stripped = text.lstrip()
+        if stripped[:1] in ("{", "["):
+            if ext == ".jsonl" or cls._looks_like_jsonl(stripped):
+                return "jsonl"
+            if not complete:
+                return "json" if ext != ".txt" else "txt"
+            try:
+                json.loads(stripped)
+            except ValueError:
+                return "txt"
+            return "json"
+        return "txt"
+
+    @staticmethod
+    def _looks_like_jsonl(text: str) -> bool:
+        """Return True when a complete JSON value is followed by another line."""
+        first_line, _, rest = text.partition("\n")
+        if rest.lstrip()[:1] not in ("{", "["):
+            return False
+        try:
+            json.loads(first_line)
+        except ValueError:
+            return False
+        return True
@@ -0,0 +1,179 @@
+"""Per-stage wall/CPU timers, counters and optional cProfile capture."""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ContextManager, Iterable, Iterator, TypeVar
+
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class StageStats:
+    """Accumulated time of one pipeline stage."""
+
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+
+
+class StageProfiler:
+    """Time named pipeline stages and count pipeline events.
+
+    Times are exclusive: entering a stage while another one is running pauses
+    the outer stage, so stage times add up to the instrumented total. This
+    also makes lazy streams measurable, since ``iter_stage`` charges each
+    pulled chunk to its own stage. CPU time is measured per thread and does
+    not include child processes such as Tesseract.
+
+    With ``profile`` set, every stage also gets its own ``cProfile`` profile,
+    enabled only while that stage is the innermost running one.
+
+    A profiler is meant for one analysis at a time and is not thread safe.
+    """
+
+    def __init__(self, profile: bool = False) -> None:
+        self.profile = profile
+        self.stages: dict[str, StageStats] = {}
+        self.counters: dict[str, int] = {}
+        self.profiles: dict[str, Any] = {}
+        self._stack: list[str] = []
+        self._wall = 0.0
+        self._cpu = 0.0
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage ``name``."""
+        self._switch()
+        self._stack.append(name)
+        self.stages.setdefault(name, StageStats()).calls += 1
+        if self.profile:
+            self._profile_for(name).enable()
+        try:
+            yield
+        finally:
+            self._switch()
+            self._stack.pop()
+            if self.profile and self._stack:
+                self.profiles[self._stack[-1]].enable()
+
+    def iter_stage(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield from ``iterable``, charging the work of each item to ``name``."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to counter ``name``."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return stage times in milliseconds and counters, JSON serializable."""
+        return {
+            "stages": {
+                name: {
+                    "calls": stats.calls,
+                    "wall_ms": round(stats.wall * 1000, 3),
+                    "cpu_ms": round(stats.cpu * 1000, 3),
+                }
+                for name, stats in self.stages.items()
+            },
+            "total_wall_ms": round(
+                sum(stats.wall for stats in self.stages.values()) * 1000, 3
+            ),
+            "counters": dict(self.counters),
+        }
+
+    def format_table(self) -> str:
+        """Return a human readable summary of stage times and counters."""
+        total = sum(stats.wall for stats in self.stages.values())
+        lines = [f"{'stage':<12} {'calls':>6} {'wall ms':>10} {'cpu ms':>10} {'%':>6}"]
+        for name, stats in self.stages.items():
+            share = 100 * stats.wall / total if total > 0 else 0.0
+            lines.append(
+                f"{name:<12} {stats.calls:>6} {stats.wall * 1000:>10.1f} "
+                f"{stats.cpu * 1000:>10.1f} {share:>6.1f}"
+            )
+        lines.append(f"{'total':<12} {'':>6} {total * 1000:>10.1f}")
+        for name, value in self.counters.items():
+            lines.append(f"{name}: {value}")
+        return "\n".join(lines)
+
+    def dump_profiles(self, directory: str | Path, limit: int = 30) -> list[Path]:
+        """Write ``<stage>.prof`` pstats files and ``<stage>.txt`` summaries.
+
+        Args:
+            directory: Output directory, created if needed.
+            limit: Number of functions listed in each text summary.
+
+        Returns:
+            Paths of the written ``.prof`` files.
+        """
+        import io
+        import pstats
+
+        output_path = Path(directory)
+        output_path.mkdir(parents=True, exist_ok=True)
+        written: list[Path] = []
+        for name, profile in self.profiles.items():
+            prof_path = output_path / f"{name}.prof"
+            profile.dump_stats(str(prof_path))
+            buffer = io.StringIO()
+            stats = pstats.Stats(profile, stream=buffer)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+            (output_path / f"{name}.txt").write_text(
+                buffer.getvalue(), encoding="utf-8"
+            )
+            written.append(prof_path)
+        LOGGER.info("Wrote %d stage profiles to %s", len(written), output_path)
+        return written
+
+    def _profile_for(self, name: str) -> Any:
+        profile = self.profiles.get(name)
+        if profile is None:
+            import cProfile
+
+            profile = cProfile.Profile()
+            self.profiles[name] = profile
+        return profile
+
+    def _switch(self) -> None:
+        """Charge the time since the last switch to the innermost stage."""
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        if self._stack:
+            current = self._stack[-1]
+            if self.profile:
+                self.profiles[current].disable()
+            stats = self.stages[current]
+            stats.wall += wall - self._wall
+            stats.cpu += cpu - self._cpu
+        self._wall = wall
+        self._cpu = cpu
+
+
+class NullProfiler(StageProfiler):
+    """Profiler that records nothing, used when instrumentation is off."""
+
+    def stage(self, name: str) -> ContextManager[None]:  # type: ignore[override]
+        return nullcontext()
+
+    def iter_stage(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        return iter(iterable)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        return None
+
+
+NULL_PROFILER = NullProfiler()
@@ -5,7 +5,7 @@ import logging
 from dataclasses import dataclass
 from typing import Iterable
 
-from resume_profiling.skill_extractor import SkillExtractor, SkillExtractionResult, SKILL_DICTIONARY
+from resume_profiling.skill_extractor import SkillExtractor, SkillExtractionResult
 
 
 LOGGER = logging.getLogger(__name__)
@@ -20,10 +20,14 @@ class JobSkillResult:
 
 
 class JobParser:
-    """Extract required skills from job description text."""
+    """Extract required skills from job description text.
+
+    The compiled matcher is shared with every ``SkillExtractor`` of the
+    process that uses the same dictionary.
+    """
 
     def __init__(self, skill_dictionary: Iterable[str] | None = None) -> None:
-        self._extractor = SkillExtractor(skill_dictionary or SKILL_DICTIONARY)
+        self._extractor = SkillExtractor(skill_dictionary)
 
     def extract_required_skills(self, text: str) -> JobSkillResult:
         """Extract skills from job description text.
@@ -1,46 +1,146 @@
-"""Logging configuration for the Resume Intelligence Engine."""
+"""Logging configuration for the Resume Intelligence Engine.
+
+Records are handed to a ``QueueHandler`` and formatted and written by a
+``QueueListener`` thread, so the analysis threads never block on console or
+file I/O. Worker processes forward their records to the parent's listener
+through a multiprocessing queue (see ``worker_log_queue``).
+"""
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any
 
 
 DEFAULT_LOG_FILE = "resume_profiling.log"
+DEFAULT_MAX_BYTES = 10_000_000
+DEFAULT_BACKUP_COUNT = 3
+
+
+# Listeners and queues of the current configuration, stopped on reconfiguration
+# and at exit.
+_STATE: dict[str, Any] = {"listeners": [], "handlers": [], "worker_queue": None}
 
 
-def configure_logging(log_file: str | None = None, level: int = logging.INFO) -> None:
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler for a listener in the same process.
+
+    The stdlib ``prepare`` formats the message and copies the record so it
+    can be pickled; in-process the record is passed on as is and formatted
+    once, by the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(
+    log_file: str | None = None,
+    level: int = logging.INFO,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+) -> None:
     """Configure application-wide logging.
 
     Args:
         log_file: Optional log file name or path.
         level: Logging level.
+        max_bytes: Size at which the log file is rotated.
+        backup_count: Number of rotated log files to keep.
     """
     log_path = Path(log_file or DEFAULT_LOG_FILE)
     log_path.parent.mkdir(parents=True, exist_ok=True)
+    _stop_listeners()
 
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(level)
-
-    if root_logger.handlers:
-        for handler in list(root_logger.handlers):
-            root_logger.removeHandler(handler)
-
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
     file_handler = RotatingFileHandler(
         filename=str(log_path),
-        maxBytes=1_000_000,
-        backupCount=3,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
         encoding="utf-8",
     )
     file_handler.setFormatter(formatter)
 
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    handlers = [console_handler, file_handler]
+    record_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(record_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _STATE["listeners"] = [listener]
+    _STATE["handlers"] = handlers
+    _install_queue_handler(_LocalQueueHandler(record_queue), level)
+
+
+def worker_log_queue() -> Any | None:
+    """Return a multiprocessing queue feeding the configured log handlers.
+
+    The queue is created on first use and served by its own listener thread.
+    Pass it to ``configure_worker_logging`` in each worker process.
+
+    Returns:
+        The queue, or None when ``configure_logging`` has not been called.
+    """
+    if not _STATE["handlers"]:
+        return None
+    if _STATE["worker_queue"] is None:
+        import multiprocessing
+
+        worker_queue = multiprocessing.Queue(-1)
+        listener = QueueListener(
+            worker_queue, *_STATE["handlers"], respect_handler_level=True
+        )
+        listener.start()
+        _STATE["listeners"].append(listener)
+        _STATE["worker_queue"] = worker_queue
+    return _STATE["worker_queue"]
+
+
+def configure_worker_logging(log_queue: Any, level: int = logging.INFO) -> None:
+    """Send a worker process's records to the parent through ``log_queue``.
+
+    Handlers inherited from a forked parent are replaced, since the parent's
+    listener threads do not exist in the child.
+
+    Args:
+        log_queue: Queue returned by ``worker_log_queue`` in the parent.
+        level: Logging level.
+    """
+    _STATE["listeners"] = []
+    _STATE["handlers"] = []
+    _STATE["worker_queue"] = None
+    # Records cross a process boundary here, so keep the pickling prepare.
+    _install_queue_handler(QueueHandler(log_queue), level)
+
+
+def _install_queue_handler(handler: QueueHandler, level: int) -> None:
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    for existing in list(root_logger.handlers):
+        root_logger.removeHandler(existing)
+    root_logger.addHandler(handler)
+
+
+def _stop_listeners() -> None:
+    """Flush pending records and close the handlers of the current setup."""
+    for listener in _STATE["listeners"]:
+        listener.stop()
+    for handler in _STATE["handlers"]:
+        handler.close()
+    worker_queue = _STATE["worker_queue"]
+    if worker_queue is not None:
+        worker_queue.close()
+    _STATE["listeners"] = []
+    _STATE["handlers"] = []
+    _STATE["worker_queue"] = None
+
+
+atexit.register(_stop_listeners)
@@ -9,15 +9,16 @@ from pathlib import Path
 if __package__ in (None, ""):
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from resume_profiling.batch import run_batch
+from resume_profiling.extraction_cache import ExtractionCache
 from resume_profiling.extractor_router import ExtractorRouter
+from resume_profiling.instrumentation import NULL_PROFILER, StageProfiler
 from resume_profiling.job_parser import JobParser
-from resume_profiling.job_roles import JOB_ROLES
 from resume_profiling.logger_config import configure_logging
-from resume_profiling.matcher import SkillMatcher
-from resume_profiling.report_generator import ReportGenerator
-from resume_profiling.scoring_engine import ScoringEngine
+from resume_profiling.pipeline import analyze_resume
+from resume_profiling.role_catalog import load_index
+from resume_profiling.role_index import RoleIndex
 from resume_profiling.skill_extractor import SkillExtractor
-from resume_profiling.text_cleaner import TextCleaner
 
 
 LOGGER = logging.getLogger(__name__)
@@ -28,13 +29,83 @@ def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Resume Profiling",
     )
-    parser.add_argument("--resume", required=True, help="Path to resume file")
+    resume_group = parser.add_mutually_exclusive_group(required=True)
+    resume_group.add_argument("--resume", help="Path to resume file")
+    resume_group.add_argument(
+        "--resume-dir",
+        help="Directory of resumes to analyze in batch mode",
+    )
     parser.add_argument("--job", required=True, help="Path to job description file")
+    parser.add_argument(
+        "--glob",
+        default="*",
+        help="Glob pattern for resumes inside --resume-dir (default: *)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch mode (default: CPU count)",
+    )
     parser.add_argument(
         "--output",
         default=".",
         help="Output directory for reports (default: current directory)",
     )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=None,
+        help="Only rank the K best matching roles, skipping roles with no "
+        "skill in common with the resume (default: rank all roles)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Optional directory for caching extracted text across runs "
+        "(default: no cache)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=512,
+        help="Size limit of the extraction cache in megabytes (default: 512)",
+    )
+    parser.add_argument(
+        "--roles",
+        default=None,
+        help="Optional JSON or TOML role catalogue; its built index is cached "
+        "next to it as <file>.index (default: built-in roles)",
+    )
+    parser.add_argument(
+        "--matcher-dir",
+        default=None,
+        help="Optional directory for the compiled skill matcher artifact, "
+        "built on first use and rebuilt when the skill dictionary changes "
+        "(default: compile at startup)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process resumes chunk by chunk to bound memory on very large "
+        "documents (disables the extraction cache for resumes)",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Add per-stage wall and CPU times and counters to the JSON "
+        "report and print them",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="DIR",
+        help="Profile each stage with cProfile and write <stage>.prof and "
+        "<stage>.txt files to DIR (default: <output>/profile); implies "
+        "--timings. Single resumes only",
+    )
     parser.add_argument(
         "--log",
         default=None,
@@ -43,58 +114,59 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def run_pipeline(resume_path: str, job_path: str, output_dir: str) -> int:
+def run_pipeline(
+    resume_path: str,
+    job_path: str,
+    output_dir: str,
+    top_k: int | None = None,
+    cache: ExtractionCache | None = None,
+    stream: bool = False,
+    timings: bool = False,
+    profile_dir: str | None = None,
+    roles_path: str | None = None,
+) -> int:
     """Run the full analysis pipeline with per-role matching.
 
     Args:
         resume_path: Path to resume.
         job_path: Path to job description.
         output_dir: Output directory for reports.
+        top_k: Optional number of best roles to keep; all roles when None.
+        cache: Optional extraction cache shared across runs.
+        stream: Process the resume chunk by chunk.
+        timings: Add per-stage timings to the report and print them.
+        profile_dir: Optional directory for per-stage cProfile output;
+            implies ``timings``.
+        roles_path: Optional role catalogue file instead of the built-in
+            roles.
 
     Returns:
         Exit code.
     """
+    profiler = None
+    if timings or profile_dir is not None:
+        profiler = StageProfiler(profile=profile_dir is not None)
+    stages = profiler or NULL_PROFILER
     try:
-        resume_text_raw = ExtractorRouter.extract(resume_path)
-        job_text_raw = ExtractorRouter.extract(job_path)
-
-        resume_text = TextCleaner.clean(resume_text_raw)
-        job_text = TextCleaner.clean(job_text_raw)
-
-        resume_extractor = SkillExtractor()
-        resume_result = resume_extractor.extract(resume_text)
-
-        # Analyze per role
-        role_results = []
-        for role in JOB_ROLES:
-            role_skill_counts = {skill: 1 for skill in role.skills}
-            match_result = SkillMatcher.compare(
-                resume_result.skills,
-                role.skills,
-                resume_result.matches,
-                role_skill_counts,
-            )
-            score_result = ScoringEngine.score(
-                match_percentage=match_result.match_percentage,
-                resume_skills=resume_result.skills,
-                job_skills=role.skills,
-                resume_counts=resume_result.matches,
-                job_counts=role_skill_counts,
+        with stages.stage("job"):
+            _, job_text = ExtractorRouter.extract_and_clean(job_path, cache=cache)
+        with stages.stage("setup"):
+            extractor = SkillExtractor()
+            role_index = (
+                load_index(roles_path) if roles_path else RoleIndex.default()
             )
-            role_results.append({
-                "role": role.name,
-                "category": role.category,
-                "match_result": match_result,
-                "score_result": score_result,
-            })
-
-        ReportGenerator.generate_multi_role(
-            resume_skills=resume_result.skills,
-            role_results=role_results,
-            output_dir=output_dir,
+
+        analyze_resume(
+            resume_path,
+            output_dir,
+            extractor=extractor,
+            role_index=role_index,
+            top_k=top_k,
+            cache=cache,
+            stream=stream,
+            profiler=profiler,
         )
         LOGGER.info("Pipeline completed successfully")
-        return 0
     except FileNotFoundError as exc:
         LOGGER.error("Missing file: %s", exc)
         return 2
@@ -102,14 +174,124 @@ def run_pipeline(resume_path: str, job_path: str, output_dir: str) -> int:
         LOGGER.exception("Pipeline failed: %s", exc)
         return 1
 
+    if profiler is not None:
+        print(profiler.format_table())
+        if profile_dir is not None:
+            profiler.dump_profiles(profile_dir)
+            print(f"Stage profiles written to {profile_dir}")
+    return 0
+
+
+def run_batch_pipeline(
+    resume_dir: str,
+    job_path: str,
+    output_dir: str,
+    pattern: str = "*",
+    workers: int | None = None,
+    top_k: int | None = None,
+    cache: ExtractionCache | None = None,
+    stream: bool = False,
+    timings: bool = False,
+    roles_path: str | None = None,
+) -> int:
+    """Run the analysis pipeline for every resume in a directory.
+
+    Args:
+        resume_dir: Directory containing resumes, or a JSON Lines file.
+        job_path: Path to job description.
+        output_dir: Output directory for reports.
+        pattern: Glob pattern for resumes inside ``resume_dir``.
+        workers: Number of worker processes (default: CPU count).
+        top_k: Optional number of best roles to keep; all roles when None.
+        cache: Optional extraction cache shared across runs.
+        stream: Process each resume chunk by chunk.
+        timings: Add per-stage timings to every report.
+        roles_path: Optional role catalogue file instead of the built-in
+            roles.
+
+    Returns:
+        Exit code.
+    """
+    try:
+        ExtractorRouter.extract_and_clean(job_path, cache=cache)
+        summary = run_batch(
+            resume_dir,
+            output_dir,
+            pattern=pattern,
+            workers=workers,
+            top_k=top_k,
+            cache=cache,
+            stream=stream,
+            timings=timings,
+            roles_path=roles_path,
+        )
+    except FileNotFoundError as exc:
+        LOGGER.error("Missing file: %s", exc)
+        return 2
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.exception("Batch failed: %s", exc)
+        return 1
+
+    print(
+        f"Processed {summary.processed} resumes in {summary.elapsed:.2f}s "
+        f"({summary.throughput:.1f} resumes/s), {len(summary.failed)} failed"
+    )
+    for resume_path, error in summary.failed:
+        print(f"  FAILED {resume_path}: {error}")
+    return 1 if summary.failed else 0
+
 
 def main() -> None:
     """CLI entry point."""
     parser = build_parser()
     args = parser.parse_args()
+    if args.top_k is not None and args.top_k < 1:
+        parser.error("--top-k must be a positive integer")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be a positive integer")
 
     configure_logging(log_file=args.log)
-    exit_code = run_pipeline(args.resume, args.job, args.output)
+    if args.matcher_dir:
+        SkillExtractor.ARTIFACT_DIR = Path(args.matcher_dir)
+    cache = None
+    if args.cache_dir:
+        cache = ExtractionCache(
+            args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024
+        )
+    # Every record of a JSON Lines export is a resume of its own.
+    resume_dir = args.resume_dir
+    if args.resume and Path(args.resume).suffix.lower() == ".jsonl":
+        resume_dir = args.resume
+    profile_dir = args.profile
+    if profile_dir == "":
+        profile_dir = str(Path(args.output) / "profile")
+    if resume_dir:
+        if profile_dir is not None:
+            parser.error("--profile is only supported with a single --resume")
+        exit_code = run_batch_pipeline(
+            resume_dir,
+            args.job,
+            args.output,
+            pattern=args.glob,
+            workers=args.workers,
+            top_k=args.top_k,
+            cache=cache,
+            stream=args.stream,
+            timings=args.timings,
+            roles_path=args.roles,
+        )
+    else:
+        exit_code = run_pipeline(
+            args.resume,
+            args.job,
+            args.output,
+            top_k=args.top_k,
+            cache=cache,
+            stream=args.stream,
+            timings=args.timings,
+            profile_dir=profile_dir,
+            roles_path=args.roles,
+        )
     sys.exit(exit_code)
 
 
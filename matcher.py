@@ -71,7 +71,7 @@ class SkillMatcher:
         cosine_sim = cls._cosine_similarity(resume_counts, job_counts)
         match_percentage = overlap_ratio * 100.0
 
-        LOGGER.info(
+        LOGGER.debug(
             "Match percentage: %.2f, cosine similarity: %.3f",
             match_percentage,
             cosine_sim,
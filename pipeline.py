@@ -0,0 +1,209 @@
+"""Reusable analysis steps shared by the CLI entry points."""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from resume_profiling.extraction_cache import ExtractionCache
+from resume_profiling.extractor_router import ExtractorRouter
+from resume_profiling.extractors.json_extractor import JsonlExtractor
+from resume_profiling.instrumentation import NULL_PROFILER, StageProfiler
+from resume_profiling.report_generator import DEFAULT_REPORT_NAME, ReportGenerator
+from resume_profiling.role_index import RoleIndex
+from resume_profiling.skill_extractor import SkillExtractionResult, SkillExtractor
+from resume_profiling.text_cleaner import TextCleaner
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def score_roles(
+    resume_result: SkillExtractionResult,
+    role_index: RoleIndex,
+    top_k: int | None = None,
+) -> list[dict[str, Any]]:
+    """Score extracted resume skills against the roles of an index.
+
+    Args:
+        resume_result: Skills extracted from the resume.
+        role_index: Role index to score against.
+        top_k: Optional number of best roles to keep; all roles when None.
+
+    Returns:
+        Role results as consumed by ``ReportGenerator.generate_multi_role``.
+    """
+    if top_k is None:
+        return role_index.score_all(resume_result.skills, resume_result.matches)
+    return role_index.score_top_k(
+        resume_result.skills, resume_result.matches, top_k
+    )
+
+
+def build_report(
+    resume_text: str,
+    extractor: SkillExtractor,
+    role_index: RoleIndex,
+    top_k: int | None = None,
+    output_dir: str | Path | None = None,
+    report_name: str = DEFAULT_REPORT_NAME,
+    profiler: StageProfiler | None = None,
+) -> dict[str, Any]:
+    """Extract skills from cleaned resume text, score roles and build a report.
+
+    Args:
+        resume_text: Cleaned resume text.
+        extractor: Skill extractor to reuse.
+        role_index: Role index to score against.
+        top_k: Optional number of best roles to keep; all roles when None.
+        output_dir: Output directory for reports, or None to skip writing.
+        report_name: Base file name of the reports.
+        profiler: Optional profiler; its timings are added to the report.
+
+    Returns:
+        Report data.
+    """
+    with (profiler or NULL_PROFILER).stage("skills"):
+        resume_result = extractor.extract(resume_text)
+    return build_skill_report(
+        resume_result,
+        role_index,
+        top_k=top_k,
+        output_dir=output_dir,
+        report_name=report_name,
+        profiler=profiler,
+    )
+
+
+def build_skill_report(
+    resume_result: SkillExtractionResult,
+    role_index: RoleIndex,
+    top_k: int | None = None,
+    output_dir: str | Path | None = None,
+    report_name: str = DEFAULT_REPORT_NAME,
+    profiler: StageProfiler | None = None,
+) -> dict[str, Any]:
+    """Score already extracted resume skills and build a report.
+
+    Args:
+        resume_result: Skills extracted from the resume.
+        role_index: Role index to score against.
+        top_k: Optional number of best roles to keep; all roles when None.
+        output_dir: Output directory for reports, or None to skip writing.
+        report_name: Base file name of the reports.
+        profiler: Optional profiler; when given, the report gets a
+            ``timings`` entry with the stage times recorded so far (writing
+            the report files is timed but not included).
+
+    Returns:
+        Report data.
+    """
+    stages = profiler or NULL_PROFILER
+    stages.count("skills", len(resume_result.skills))
+    with stages.stage("score"):
+        role_results = score_roles(resume_result, role_index, top_k)
+    stages.count("roles_scored", len(role_results))
+    with stages.stage("report"):
+        report_data = ReportGenerator.generate_multi_role(
+            resume_skills=resume_result.skills,
+            role_results=role_results,
+            output_dir=None,
+        )
+    if profiler is not None:
+        report_data["timings"] = profiler.as_dict()
+    if output_dir is not None:
+        with stages.stage("write"):
+            ReportGenerator.write_multi_role(report_data, output_dir, report_name)
+    return report_data
+
+
+def analyze_resume(
+    resume_path: str | Path,
+    output_dir: str | Path | None,
+    extractor: SkillExtractor,
+    role_index: RoleIndex,
+    top_k: int | None = None,
+    cache: ExtractionCache | None = None,
+    report_name: str = DEFAULT_REPORT_NAME,
+    stream: bool = False,
+    profiler: StageProfiler | None = None,
+) -> dict[str, Any]:
+    """Extract, score and report a single resume with prebuilt components.
+
+    Args:
+        resume_path: Path to resume.
+        output_dir: Output directory for reports, or None to skip writing.
+        extractor: Skill extractor to reuse.
+        role_index: Role index to score against.
+        top_k: Optional number of best roles to keep; all roles when None.
+        cache: Optional extraction cache, ignored when streaming.
+        report_name: Base file name of the reports.
+        stream: Extract, clean and count skills chunk by chunk so that the
+            full document text is never held in memory.
+        profiler: Optional profiler timing each stage; its timings are
+            added to the report.
+
+    Returns:
+        Report data.
+    """
+    stages = profiler or NULL_PROFILER
+    if stream:
+        raw_chunks = stages.iter_stage(
+            "extract", ExtractorRouter.iter_extract(resume_path)
+        )
+        chunks = stages.iter_stage("clean", TextCleaner.clean_stream(raw_chunks))
+        with stages.stage("skills"):
+            resume_result = extractor.extract_stream(chunks)
+    else:
+        _, resume_text = ExtractorRouter.extract_and_clean(
+            resume_path, cache=cache, profiler=profiler
+        )
+        with stages.stage("skills"):
+            resume_result = extractor.extract(resume_text)
+    return build_skill_report(
+        resume_result,
+        role_index,
+        top_k=top_k,
+        output_dir=output_dir,
+        report_name=report_name,
+        profiler=profiler,
+    )
+
+
+def analyze_record(
+    record: str,
+    output_dir: str | Path,
+    extractor: SkillExtractor,
+    role_index: RoleIndex,
+    top_k: int | None = None,
+    report_name: str = DEFAULT_REPORT_NAME,
+    profiler: StageProfiler | None = None,
+) -> dict[str, Any]:
+    """Analyze one JSON Lines record as a resume of its own.
+
+    Args:
+        record: Raw JSON line.
+        output_dir: Output directory for reports.
+        extractor: Skill extractor to reuse.
+        role_index: Role index to score against.
+        top_k: Optional number of best roles to keep; all roles when None.
+        report_name: Base file name of the reports.
+        profiler: Optional profiler; its timings are added to the report.
+
+    Returns:
+        Report data.
+    """
+    stages = profiler or NULL_PROFILER
+    with stages.stage("extract"):
+        raw_text = JsonlExtractor.record_text(record)
+    with stages.stage("clean"):
+        resume_text = TextCleaner.clean(raw_text)
+    return build_report(
+        resume_text,
+        extractor,
+        role_index,
+        top_k=top_k,
+        output_dir=output_dir,
+        report_name=report_name,
+        profiler=profiler,
+    )
@@ -14,6 +14,9 @@ from resume_profiling.scoring_engine import ScoreResult
 LOGGER = logging.getLogger(__name__)
 
 
+DEFAULT_REPORT_NAME = "analysis_report"
+
+
 class ReportGenerator:
     """Generate JSON and TXT analysis reports."""
 
@@ -117,21 +120,21 @@ class ReportGenerator:
         cls,
         resume_skills: list[str],
         role_results: list[dict[str, Any]],
-        output_dir: str | Path = ".",
+        output_dir: str | Path | None = ".",
+        report_name: str = DEFAULT_REPORT_NAME,
     ) -> dict[str, Any]:
         """Generate JSON and TXT reports with per-role analysis.
 
         Args:
             resume_skills: Skills extracted from resume.
             role_results: List of role analysis results.
-            output_dir: Output directory for reports.
+            output_dir: Output directory for reports, or None to only build
+                the report data without writing files.
+            report_name: Base file name of the reports, without extension.
 
         Returns:
             Dictionary with report data.
         """
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-
         # Sort by score descending
         sorted_results = sorted(
             role_results,
@@ -181,14 +184,33 @@ class ReportGenerator:
             "roles": roles_data,
         }
 
-        json_path = output_path / "analysis_report.json"
-        txt_path = output_path / "analysis_report.txt"
+        if output_dir is not None:
+            cls.write_multi_role(report_data, output_dir, report_name)
+        return report_data
+
+    @classmethod
+    def write_multi_role(
+        cls,
+        report_data: dict[str, Any],
+        output_dir: str | Path = ".",
+        report_name: str = DEFAULT_REPORT_NAME,
+    ) -> None:
+        """Write report data built by ``generate_multi_role`` as JSON and TXT.
+
+        Args:
+            report_data: Report data.
+            output_dir: Output directory for reports.
+            report_name: Base file name of the reports, without extension.
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        json_path = output_path / f"{report_name}.json"
+        txt_path = output_path / f"{report_name}.txt"
 
         json_path.write_text(json.dumps(report_data, indent=2), encoding="utf-8")
         txt_path.write_text(cls._format_multi_role_txt(report_data), encoding="utf-8")
 
         LOGGER.info("Reports generated at %s", output_path)
-        return report_data
 
     @staticmethod
     def _format_multi_role_txt(report_data: dict[str, Any]) -> str:
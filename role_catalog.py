@@ -0,0 +1,279 @@
+"""Role catalogues loaded from data files, with a cached prebuilt index.
+
+A catalogue is a JSON or TOML file listing roles::
+
+    {"roles": [{"name": "Data Analyst", "category": "Data & Analytics",
+                "skills": ["python", "sql", "tableau"]}]}
+
+    [[roles]]
+    name = "Data Analyst"
+    category = "Data & Analytics"
+    skills = ["python", "sql", "tableau"]
+
+The ``RoleIndex`` built from a catalogue is stored next to it as
+``<file>.index`` and reused while the catalogue bytes, the skill dictionary
+and the index format are unchanged. The cache is plain JSON data, so a
+tampered file can at worst produce wrong scores or be rebuilt, never run
+code. Export the built-in roles or prebuild the index with::
+
+    python -m resume_profiling.role_catalog export roles.json
+    python -m resume_profiling.role_catalog build roles.json
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Sequence
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from resume_profiling.compiled_matcher import dictionary_hash
+from resume_profiling.job_roles import JobRole
+from resume_profiling.role_index import RoleIndex
+from resume_profiling.skill_extractor import SKILL_DICTIONARY
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+INDEX_FORMAT = 2
+INDEX_SUFFIX = ".index"
+
+
+def parse_roles(data: bytes, suffix: str) -> list[JobRole]:
+    """Parse catalogue content.
+
+    Args:
+        data: Catalogue file bytes.
+        suffix: File extension selecting the format (``.json`` or ``.toml``).
+
+    Returns:
+        Roles in file order, with skills lowercased.
+
+    Raises:
+        ValueError: If the content is malformed or the format unsupported.
+    """
+    suffix = suffix.lower()
+    if suffix == ".json":
+        payload: Any = json.loads(data.decode("utf-8"))
+    elif suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError as exc:
+            raise ValueError("TOML catalogues need Python 3.11+") from exc
+
+        payload = tomllib.loads(data.decode("utf-8"))
+    else:
+        raise ValueError(f"Unsupported role catalogue format: {suffix or '?'}")
+
+    entries = payload.get("roles") if isinstance(payload, dict) else payload
+    if not isinstance(entries, list):
+        raise ValueError("Role catalogue must contain a list of roles")
+    roles: list[JobRole] = []
+    for position, entry in enumerate(entries, 1):
+        try:
+            name = entry["name"]
+            category = entry.get("category", "Other")
+            skills = entry["skills"]
+        except (KeyError, TypeError, AttributeError):
+            raise ValueError(f"Role {position} needs a name and skills") from None
+        if not (
+            isinstance(name, str)
+            and isinstance(category, str)
+            and isinstance(skills, list)
+            and all(isinstance(skill, str) for skill in skills)
+        ):
+            raise ValueError(f"Role {position} has invalid field types")
+        roles.append(
+            JobRole(
+                name=name,
+                category=category,
+                skills=[skill.strip().lower() for skill in skills],
+            )
+        )
+    return roles
+
+
+def load_roles(path: str | Path) -> list[JobRole]:
+    """Read the roles of a catalogue file.
+
+    Args:
+        path: JSON or TOML catalogue.
+
+    Returns:
+        Roles in file order.
+    """
+    catalogue = Path(path)
+    return parse_roles(catalogue.read_bytes(), catalogue.suffix)
+
+
+def dump_roles(roles: Sequence[JobRole], path: str | Path) -> None:
+    """Write roles as a JSON catalogue.
+
+    Args:
+        roles: Roles to write.
+        path: Output ``.json`` file.
+    """
+    payload = {
+        "roles": [
+            {"name": role.name, "category": role.category, "skills": role.skills}
+            for role in roles
+        ]
+    }
+    Path(path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def index_path(path: str | Path) -> Path:
+    """Return the index cache file of a catalogue."""
+    catalogue = Path(path)
+    return catalogue.with_name(catalogue.name + INDEX_SUFFIX)
+
+
+def _cache_key(data: bytes) -> str:
+    digest = hashlib.sha256(data)
+    digest.update(f":{INDEX_FORMAT}:{dictionary_hash(SKILL_DICTIONARY)}".encode())
+    return digest.hexdigest()
+
+
+def load_index(path: str | Path) -> RoleIndex:
+    """Return the role index of a catalogue, from its cache when current.
+
+    A missing or stale cache is rebuilt and rewritten atomically; an
+    unwritable directory only costs the build.
+
+    Args:
+        path: JSON or TOML catalogue.
+
+    Returns:
+        RoleIndex over the catalogue roles.
+    """
+    catalogue = Path(path)
+    data = catalogue.read_bytes()
+    key = _cache_key(data)
+    cache_path = index_path(catalogue)
+    try:
+        payload = json.loads(cache_path.read_bytes())
+        if payload["key"] == key:
+            LOGGER.info("Loaded role index cache %s", cache_path)
+            return RoleIndex.from_state(payload["state"])
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        LOGGER.warning("Ignoring unreadable role index cache %s: %s", cache_path, exc)
+
+    index = RoleIndex(parse_roles(data, catalogue.suffix))
+    payload_bytes = json.dumps(
+        {"key": key, "state": index.to_state()}, separators=(",", ":")
+    ).encode("utf-8")
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload_bytes)
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            os.unlink(tmp_name)
+            raise
+        LOGGER.info("Wrote role index cache %s", cache_path)
+    except OSError as exc:
+        LOGGER.warning("Failed to write role index cache %s: %s", cache_path, exc)
+    return index
+
+
+class RoleCatalog:
+    """Role index of a catalogue file, reloaded when the file changes.
+
+    ``index`` checks the file at most every ``check_interval`` seconds and
+    swaps in a new index after a change. Requests already holding the old
+    index finish with it. A catalogue that fails to load is logged and the
+    previous index stays in service until the file changes again.
+    """
+
+    CHECK_INTERVAL = 5.0
+
+    def __init__(self, path: str | Path, check_interval: float | None = None) -> None:
+        self.path = Path(path)
+        if check_interval is None:
+            check_interval = self.CHECK_INTERVAL
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature = self._stat()
+        self._index = load_index(self.path)
+        self._checked = time.monotonic()
+
+    @property
+    def index(self) -> RoleIndex:
+        """Current role index."""
+        if time.monotonic() - self._checked >= self.check_interval:
+            self.reload_if_changed()
+        return self._index
+
+    def reload_if_changed(self) -> bool:
+        """Reload the catalogue if its file changed.
+
+        Returns:
+            True when a new index was swapped in.
+        """
+        # Another thread is already checking; keep serving the current index.
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked = time.monotonic()
+            try:
+                signature = self._stat()
+            except OSError as exc:
+                LOGGER.error("Role catalogue %s unavailable: %s", self.path, exc)
+                return False
+            if signature == self._signature:
+                return False
+            self._signature = signature
+            try:
+                index = load_index(self.path)
+            except (OSError, ValueError) as exc:
+                LOGGER.error(
+                    "Keeping previous roles, failed to reload %s: %s", self.path, exc
+                )
+                return False
+            self._index = index
+            LOGGER.info("Reloaded %d roles from %s", len(index.roles), self.path)
+            return True
+        finally:
+            self._lock.release()
+
+    def _stat(self) -> tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+
+def main() -> None:
+    """Export the built-in roles or prebuild a catalogue's index cache."""
+    parser = argparse.ArgumentParser(description="Role catalogue tools")
+    parser.add_argument("command", choices=("export", "build"))
+    parser.add_argument("path", help="Catalogue file")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        from resume_profiling.job_roles import JOB_ROLES
+
+        dump_roles(JOB_ROLES, args.path)
+        print(f"Wrote {len(JOB_ROLES)} roles to {args.path}")
+        return
+    start = time.perf_counter()
+    index = load_index(args.path)
+    print(
+        f"{index_path(args.path)}: {len(index.roles)} roles, "
+        f"{(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+"""Precomputed role-by-skill index for scoring a resume against every role."""
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+from resume_profiling.job_roles import JOB_ROLES, JobRole
+from resume_profiling.matcher import MatchResult
+from resume_profiling.scoring_engine import ScoreResult, ScoringEngine
+from resume_profiling.skill_vocabulary import SkillVocabulary
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _iter_bits(bits: int) -> Iterable[int]:
+    """Yield the positions of set bits in ascending order."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+# Array attributes of a RoleIndex, all of typecode "I".
+_ARRAY_FIELDS = (
+    "role_unique_counts",
+    "role_list_lengths",
+    "column_offsets",
+    "column_roles",
+    "column_multiplicity",
+)
+
+
+@dataclass(frozen=True)
+class BatchScores:
+    """Scores for many resumes against every role of a ``RoleIndex``.
+
+    ``scores[i][r]`` is the composite score of resume ``i`` for role ``r``.
+    Resume skills are kept as bitsets; matched and missing skill lists are
+    only built when requested.
+    """
+
+    index: RoleIndex
+    resume_bits: list[int]
+    scores: list[array]
+
+    def matched_skills(self, resume_idx: int, role_idx: int) -> list[str]:
+        """Return sorted role skills present in the resume."""
+        role_bits = self.index.role_bits[role_idx]
+        return self.index.vocabulary.decode(role_bits & self.resume_bits[resume_idx])
+
+    def missing_skills(self, resume_idx: int, role_idx: int) -> list[str]:
+        """Return sorted role skills absent from the resume."""
+        role_bits = self.index.role_bits[role_idx]
+        return self.index.vocabulary.decode(role_bits & ~self.resume_bits[resume_idx])
+
+
+class RoleIndex:
+    """Sparse role x skill matrix built once from a role catalogue.
+
+    Skills are interned through a ``SkillVocabulary`` and every role keeps its
+    skill set as a bitset, so overlap with a resume is a popcount. Keyword
+    strength and cosine similarity need the resume skill counts; for those the
+    matrix is also stored column-wise, keeping for every skill the roles that
+    list it and how many times they list it. Scoring a resume only touches the
+    columns of the skills it contains, then derives the same metrics as
+    ``SkillMatcher.compare`` and ``ScoringEngine.score`` for every role.
+    """
+
+    # Roles whose full metrics are logged per resume at debug level.
+    DEBUG_ROLES = 5
+
+    _default: RoleIndex | None = None
+
+    def __init__(
+        self,
+        roles: Sequence[JobRole],
+        vocabulary: SkillVocabulary | None = None,
+    ) -> None:
+        self.roles = list(roles)
+        self.vocabulary = vocabulary or SkillVocabulary.from_dictionary()
+        self.role_bits: list[int] = []
+        self.role_unique_counts = array("I")
+        self.role_list_lengths = array("I")
+
+        columns: list[list[tuple[int, int]]] = []
+        for role_idx, role in enumerate(self.roles):
+            multiplicity: dict[int, int] = {}
+            for skill in role.skills:
+                skill_id = self.vocabulary.add(skill)
+                multiplicity[skill_id] = multiplicity.get(skill_id, 0) + 1
+            bits = 0
+            for skill_id, count in multiplicity.items():
+                while len(columns) <= skill_id:
+                    columns.append([])
+                columns[skill_id].append((role_idx, count))
+                bits |= 1 << skill_id
+            self.role_bits.append(bits)
+            self.role_unique_counts.append(len(multiplicity))
+            self.role_list_lengths.append(len(role.skills))
+        while len(columns) < len(self.vocabulary):
+            columns.append([])
+
+        self.column_offsets = array("I", [0])
+        self.column_roles = array("I")
+        self.column_multiplicity = array("I")
+        self.skill_role_masks: list[int] = []
+        for column in columns:
+            mask = 0
+            for role_idx, count in column:
+                self.column_roles.append(role_idx)
+                self.column_multiplicity.append(count)
+                mask |= 1 << role_idx
+            self.column_offsets.append(len(self.column_roles))
+            self.skill_role_masks.append(mask)
+        self._order_by_length()
+
+        LOGGER.info(
+            "Built role index: %d roles, %d skills, %d entries",
+            len(self.roles),
+            len(self.vocabulary),
+            len(self.column_roles),
+        )
+
+    def to_state(self) -> dict[str, Any]:
+        """Return the built index as JSON serializable data for ``from_state``.
+
+        Bitsets are stored as hex strings and arrays as integer lists, so the
+        state holds plain data only.
+        """
+        return {
+            "roles": [[role.name, role.category, role.skills] for role in self.roles],
+            "vocabulary": list(self.vocabulary.names),
+            "role_bits": [format(bits, "x") for bits in self.role_bits],
+            "skill_role_masks": [format(mask, "x") for mask in self.skill_role_masks],
+            **{name: getattr(self, name).tolist() for name in _ARRAY_FIELDS},
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> RoleIndex:
+        """Restore an index from ``to_state`` data without rebuilding it.
+
+        Args:
+            state: Data returned by ``to_state``.
+
+        Returns:
+            RoleIndex instance.
+        """
+        index = cls.__new__(cls)
+        index.roles = [
+            JobRole(name=name, category=category, skills=skills)
+            for name, category, skills in state["roles"]
+        ]
+        index.vocabulary = SkillVocabulary(state["vocabulary"])
+        index.role_bits = [int(bits, 16) for bits in state["role_bits"]]
+        index.skill_role_masks = [int(mask, 16) for mask in state["skill_role_masks"]]
+        for name in _ARRAY_FIELDS:
+            setattr(index, name, array("I", state[name]))
+        index._order_by_length()
+        return index
+
+    def _order_by_length(self) -> None:
+        """Order roles by skill list length, ties in catalogue order.
+
+        A role sharing no skill with a resume scores on diversity alone,
+        which only depends on its list length, so in this order such roles
+        come best first.
+        """
+        lengths = self.role_list_lengths
+        self.roles_by_length = array(
+            "I", sorted(range(len(self.roles)), key=lengths.__getitem__)
+        )
+
+    @classmethod
+    def default(cls) -> RoleIndex:
+        """Return the process-wide index for ``JOB_ROLES``, building it once."""
+        if cls._default is None:
+            cls._default = cls(JOB_ROLES)
+        return cls._default
+
+    def roles_for_skill(self, skill: str) -> list[JobRole]:
+        """Return the roles that list a skill, in catalogue order."""
+        skill_id = self.vocabulary.skill_ids.get(skill)
+        if skill_id is None or skill_id >= len(self.skill_role_masks):
+            return []
+        return [self.roles[idx] for idx in _iter_bits(self.skill_role_masks[skill_id])]
+
+    def encode(self, skills: Iterable[str]) -> int:
+        """Encode skills as a bitset over the index vocabulary."""
+        return self.vocabulary.encode(skills)
+
+    def _accumulate(
+        self, resume_counts: dict[str, int]
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """Sum cosine dot product and keyword strength per role.
+
+        Only roles reachable from the counted skills appear in the returned
+        mappings; every other role has zero for both totals.
+        """
+        dot: dict[int, int] = {}
+        strength: dict[int, int] = {}
+        skill_ids = self.vocabulary.skill_ids
+        column_count = len(self.skill_role_masks)
+        offsets = self.column_offsets
+        column_roles = self.column_roles
+        column_multiplicity = self.column_multiplicity
+        for skill, count in resume_counts.items():
+            skill_id = skill_ids.get(skill)
+            if skill_id is None or skill_id >= column_count:
+                continue
+            for pos in range(offsets[skill_id], offsets[skill_id + 1]):
+                role_idx = column_roles[pos]
+                dot[role_idx] = dot.get(role_idx, 0) + count
+                strength[role_idx] = (
+                    strength.get(role_idx, 0) + count * column_multiplicity[pos]
+                )
+        return dot, strength
+
+    def _reachable_roles(self, resume_bits: int) -> int:
+        """Return a bitset of roles sharing at least one skill with the resume."""
+        masks = self.skill_role_masks
+        reachable = 0
+        for skill_id in _iter_bits(resume_bits):
+            if skill_id < len(masks):
+                reachable |= masks[skill_id]
+        return reachable
+
+    def _role_metrics(
+        self, role_idx: int, overlap: int, strength: int, unique_resume: int
+    ) -> tuple[float, float, float, float]:
+        """Return match percentage, coverage, diversity and keyword strength."""
+        job_unique = self.role_unique_counts[role_idx]
+        overlap_ratio = overlap / job_unique if job_unique else 0.0
+        match_percentage = overlap_ratio * 100.0
+        coverage = min(max(match_percentage / 100.0, 0.0), 1.0)
+        job_skill_count = max(self.role_list_lengths[role_idx], 1)
+        diversity = min(unique_resume / job_skill_count, 1.0)
+        keyword_strength = min(strength / max(job_unique, 1), 1.0)
+        return match_percentage, coverage, diversity, keyword_strength
+
+    def _role_result(
+        self,
+        role_idx: int,
+        resume_bits: int,
+        unique_resume: int,
+        totals: tuple[dict[int, int], dict[int, int]],
+        resume_norm: float,
+    ) -> dict[str, Any]:
+        """Build the full match and score result for one role."""
+        dot, strength = totals
+        role = self.roles[role_idx]
+        role_bits = self.role_bits[role_idx]
+        job_unique = self.role_unique_counts[role_idx]
+        matched_bits = role_bits & resume_bits
+        match_percentage, coverage, diversity, keyword_strength = (
+            self._role_metrics(
+                role_idx,
+                matched_bits.bit_count(),
+                strength.get(role_idx, 0),
+                unique_resume,
+            )
+        )
+        if resume_norm == 0.0 or job_unique == 0:
+            cosine_sim = 0.0
+        else:
+            cosine_sim = dot.get(role_idx, 0) / (
+                math.sqrt(resume_norm) * math.sqrt(float(job_unique))
+            )
+
+        return {
+            "role": role.name,
+            "category": role.category,
+            "match_result": MatchResult(
+                match_percentage=match_percentage,
+                cosine_similarity=cosine_sim,
+                missing_skills=self.vocabulary.decode(role_bits & ~resume_bits),
+                strength_skills=self.vocabulary.decode(matched_bits),
+            ),
+            "score_result": ScoreResult(
+                score=ScoringEngine.composite(coverage, diversity, keyword_strength),
+                coverage=coverage,
+                diversity=diversity,
+                keyword_strength=keyword_strength,
+            ),
+        }
+
+    @classmethod
+    def _log_scores(cls, role_results: list[dict[str, Any]]) -> None:
+        """Log a score summary and the best roles' metrics at debug level.
+
+        Replaces one log record per role, which dominated logging cost.
+        """
+        if not role_results or not LOGGER.isEnabledFor(logging.DEBUG):
+            return
+        scores = [result["score_result"].score for result in role_results]
+        LOGGER.debug(
+            "Role scores over %d roles: min=%.2f, mean=%.2f, max=%.2f",
+            len(scores),
+            min(scores),
+            sum(scores) / len(scores),
+            max(scores),
+        )
+        best = heapq.nlargest(
+            cls.DEBUG_ROLES, role_results, key=lambda r: r["score_result"].score
+        )
+        for result in best:
+            match_result = result["match_result"]
+            score_result = result["score_result"]
+            LOGGER.debug(
+                "%s: match=%.2f, cosine=%.3f, score=%.2f "
+                "(coverage=%.2f, diversity=%.2f, strength=%.2f)",
+                result["role"],
+                match_result.match_percentage,
+                match_result.cosine_similarity,
+                score_result.score,
+                score_result.coverage,
+                score_result.diversity,
+                score_result.keyword_strength,
+            )
+
+    @staticmethod
+    def _resume_norm(resume_counts: dict[str, int]) -> float:
+        resume_norm = 0.0
+        for count in resume_counts.values():
+            resume_norm += float(count) ** 2
+        return resume_norm
+
+    def score_all(
+        self, resume_skills: Iterable[str], resume_counts: dict[str, int]
+    ) -> list[dict[str, Any]]:
+        """Score a resume against every role in the index.
+
+        Args:
+            resume_skills: Candidate skills list.
+            resume_counts: Candidate skill counts.
+
+        Returns:
+            Role results in catalogue order, each with ``role``, ``category``,
+            ``match_result`` and ``score_result`` keys.
+        """
+        resume_set = set(resume_skills)
+        resume_bits = self.encode(resume_set)
+        totals = self._accumulate(resume_counts)
+        resume_norm = self._resume_norm(resume_counts)
+
+        role_results = [
+            self._role_result(
+                role_idx, resume_bits, len(resume_set), totals, resume_norm
+            )
+            for role_idx in range(len(self.roles))
+        ]
+        LOGGER.info("Scored %d roles", len(role_results))
+        self._log_scores(role_results)
+        return role_results
+
+    def score_top_k(
+        self,
+        resume_skills: Iterable[str],
+        resume_counts: dict[str, int],
+        k: int,
+    ) -> list[dict[str, Any]]:
+        """Score a resume against every role, keep the top k.
+
+        Roles sharing skills with the resume are scored from the sparse
+        columns. The others score on diversity alone, so only the best ``k``
+        of them, plus any tied with the last one, are taken from
+        ``roles_by_length``. Candidates are ranked with a bounded heap and
+        only the best ``k`` get full match results, so the output equals the
+        first ``k`` roles of ``score_all`` sorted by descending score.
+
+        Args:
+            resume_skills: Candidate skills list.
+            resume_counts: Candidate skill counts.
+            k: Number of roles to keep.
+
+        Returns:
+            Up to ``k`` role results ordered by descending score, ties kept
+            in catalogue order.
+        """
+        resume_set = set(resume_skills)
+        resume_bits = self.encode(resume_set)
+        unique_resume = len(resume_set)
+        totals = self._accumulate(resume_counts)
+        strength = totals[1]
+        role_bits = self.role_bits
+        composite = ScoringEngine.composite
+
+        def candidate_score(role_idx: int) -> float:
+            _, coverage, diversity, keyword_strength = self._role_metrics(
+                role_idx,
+                (role_bits[role_idx] & resume_bits).bit_count(),
+                strength.get(role_idx, 0),
+                unique_resume,
+            )
+            return composite(coverage, diversity, keyword_strength)
+
+        reachable = self._reachable_roles(resume_bits)
+        scores = {
+            role_idx: candidate_score(role_idx) for role_idx in _iter_bits(reachable)
+        }
+        # Diversity-only scores do not increase along roles_by_length.
+        disjoint = 0
+        threshold = 0.0
+        for role_idx in self.roles_by_length:
+            if reachable >> role_idx & 1:
+                continue
+            score = candidate_score(role_idx)
+            if disjoint >= k and score < threshold:
+                break
+            scores[role_idx] = score
+            disjoint += 1
+            threshold = score
+        best = heapq.nlargest(k, sorted(scores), key=scores.__getitem__)
+        resume_norm = self._resume_norm(resume_counts)
+        role_results = [
+            self._role_result(role_idx, resume_bits, unique_resume, totals, resume_norm)
+            for role_idx in best
+        ]
+        LOGGER.info(
+            "Ranked top %d of %d candidate roles (%d overlapping)",
+            len(role_results),
+            len(scores),
+            reachable.bit_count(),
+        )
+        self._log_scores(role_results)
+        return role_results
+
+    def score_batch(self, resumes: Iterable[dict[str, int]]) -> BatchScores:
+        """Score many resumes against every role in one call.
+
+        Args:
+            resumes: Skill count mappings, one per resume, as produced in
+                ``SkillExtractionResult.matches``.
+
+        Returns:
+            BatchScores holding an N x roles score matrix.
+        """
+        role_count = len(self.roles)
+        role_bits = self.role_bits
+        composite = ScoringEngine.composite
+        resume_bits_list: list[int] = []
+        scores: list[array] = []
+        for resume_counts in resumes:
+            resume_bits = self.encode(resume_counts)
+            _, strength = self._accumulate(resume_counts)
+            unique_resume = len(resume_counts)
+            row = array("d", bytes(8 * role_count))
+            for role_idx in range(role_count):
+                _, coverage, diversity, keyword_strength = self._role_metrics(
+                    role_idx,
+                    (role_bits[role_idx] & resume_bits).bit_count(),
+                    strength.get(role_idx, 0),
+                    unique_resume,
+                )
+                row[role_idx] = composite(coverage, diversity, keyword_strength)
+            resume_bits_list.append(resume_bits)
+            scores.append(row)
+
+        LOGGER.info("Scored %d resumes against %d roles", len(scores), role_count)
+        return BatchScores(index=self, resume_bits=resume_bits_list, scores=scores)
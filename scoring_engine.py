@@ -21,8 +21,34 @@ class ScoreResult:
 class ScoringEngine:
     """Compute a numeric candidate score between 0 and 100."""
 
-    @staticmethod
+    COVERAGE_WEIGHT = 0.6
+    DIVERSITY_WEIGHT = 0.2
+    KEYWORD_STRENGTH_WEIGHT = 0.2
+
+    @classmethod
+    def composite(
+        cls, coverage: float, diversity: float, keyword_strength: float
+    ) -> float:
+        """Combine normalized metrics into a score clamped to 0-100.
+
+        Args:
+            coverage: Skill coverage ratio.
+            diversity: Skill diversity ratio.
+            keyword_strength: Keyword strength ratio.
+
+        Returns:
+            Weighted composite score.
+        """
+        score = (
+            coverage * cls.COVERAGE_WEIGHT
+            + diversity * cls.DIVERSITY_WEIGHT
+            + keyword_strength * cls.KEYWORD_STRENGTH_WEIGHT
+        ) * 100
+        return max(0.0, min(score, 100.0))
+
+    @classmethod
     def score(
+        cls,
         match_percentage: float,
         resume_skills: list[str],
         job_skills: list[str],
@@ -52,10 +78,9 @@ class ScoringEngine:
         total_job_strength = max(sum(job_counts.values()), 1)
         keyword_strength = min(matched_strength / total_job_strength, 1.0)
 
-        score = (coverage * 0.6 + diversity * 0.2 + keyword_strength * 0.2) * 100
-        score = max(0.0, min(score, 100.0))
+        score = cls.composite(coverage, diversity, keyword_strength)
 
-        LOGGER.info(
+        LOGGER.debug(
             "Score computed: %.2f (coverage=%.2f, diversity=%.2f, strength=%.2f)",
             score,
             coverage,
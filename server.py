@@ -0,0 +1,445 @@
+"""Long-running HTTP service that keeps the analysis engine warm.
+
+Run with ``python -m resume_profiling.server``. Endpoints:
+
+- ``GET /health`` returns ``{"status": "ok"}``, the number of roles and
+  compiled matcher cache statistics.
+- ``POST /analyze?filename=<name>[&top_k=<k>][&tenant=<id>]`` takes the raw
+  resume bytes as the request body and returns the multi-role report as
+  JSON. Uploads are extracted in memory; the filename is used as a type
+  hint. With ``tenant`` the tenant's skill dictionary is used.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+from urllib.parse import parse_qs, urlparse
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from resume_profiling.extraction_cache import ExtractionCache
+from resume_profiling.compiled_matcher import MATCHER_REGISTRY
+from resume_profiling.extractor_router import ExtractorRouter
+from resume_profiling.file_detector import UnsupportedFileTypeError
+from resume_profiling.logger_config import configure_logging
+from resume_profiling.pipeline import build_report
+from resume_profiling.role_catalog import RoleCatalog
+from resume_profiling.role_index import RoleIndex
+from resume_profiling.skill_extractor import SkillExtractor
+from resume_profiling.tenant_dictionaries import (
+    TenantConfigError,
+    TenantDictionaries,
+    UnknownTenantError,
+)
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+DEFAULT_READ_TIMEOUT = 30.0
+
+
+class ServiceBusyError(RuntimeError):
+    """Raised when no worker slot frees up in time."""
+
+
+class IncompleteUploadError(ValueError):
+    """Raised when the client closes the connection before the full body."""
+
+
+class ResumeService:
+    """Warm analysis state shared by all requests.
+
+    The skill extractor, role index and extractor backends are loaded once.
+    With a ``RoleCatalog`` the role index follows its file and is swapped
+    without a restart when the roles change. At most ``max_workers``
+    analyses run at the same time; further requests wait up to
+    ``queue_timeout`` seconds for a slot. PDF and OCR extraction use at most
+    ``extractor_workers`` processes per analysis, so the slots also bound
+    the number of extraction processes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        queue_timeout: float = 30.0,
+        cache: ExtractionCache | None = None,
+        tenants: TenantDictionaries | None = None,
+        catalog: RoleCatalog | None = None,
+        extractor_workers: int | None = 1,
+    ) -> None:
+        self.extractor = SkillExtractor()
+        self.tenants = tenants
+        self.catalog = catalog
+        self._role_index = RoleIndex.default() if catalog is None else None
+        self.cache = cache
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._preload_extractors()
+        if extractor_workers is not None:
+            for file_type in ("pdf", "image"):
+                ExtractorRouter.EXTRACTOR_MAP.configure(
+                    file_type, MAX_WORKERS=extractor_workers
+                )
+
+    @property
+    def role_index(self) -> RoleIndex:
+        """Role index used for the next analysis."""
+        if self.catalog is not None:
+            return self.catalog.index
+        return self._role_index
+
+    @staticmethod
+    def _preload_extractors() -> None:
+        for file_type in ExtractorRouter.EXTRACTOR_MAP:
+            try:
+                ExtractorRouter.EXTRACTOR_MAP[file_type]
+            except ImportError as exc:
+                LOGGER.warning("Extractor for %s unavailable: %s", file_type, exc)
+
+    def analyze(
+        self,
+        data: bytes,
+        filename: str,
+        top_k: int | None = None,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """Analyze an uploaded resume.
+
+        Args:
+            data: Resume file bytes.
+            filename: Original file name used as a type hint.
+            top_k: Optional number of best roles to keep.
+            tenant: Optional tenant whose skill dictionary is used.
+
+        Returns:
+            Report data.
+
+        Raises:
+            UnsupportedFileTypeError: If the file type is unsupported.
+            UnknownTenantError: If the tenant is not configured.
+            TenantConfigError: If the tenant's overrides file is malformed.
+            ServiceBusyError: If no worker slot is free in time.
+        """
+        with self._slot():
+            extractor = self._extractor_for(tenant)
+            return self._analyze(data, filename, extractor, top_k)
+
+    def analyze_stream(
+        self,
+        stream: BinaryIO,
+        length: int,
+        filename: str,
+        top_k: int | None = None,
+        tenant: str | None = None,
+    ) -> dict[str, Any]:
+        """Read an upload of ``length`` bytes once a worker slot is free.
+
+        Waiting requests hold no body in memory, so the worker slots bound
+        the upload memory as well as the analysis load.
+
+        Args:
+            stream: Request body stream.
+            length: Body length in bytes.
+            filename: Original file name used as a type hint.
+            top_k: Optional number of best roles to keep.
+            tenant: Optional tenant whose skill dictionary is used.
+
+        Returns:
+            Report data.
+
+        Raises:
+            UnsupportedFileTypeError: If the file type is unsupported.
+            UnknownTenantError: If the tenant is not configured.
+            TenantConfigError: If the tenant's overrides file is malformed.
+            ServiceBusyError: If no worker slot is free in time.
+            IncompleteUploadError: If the stream ends before ``length`` bytes.
+            TimeoutError: If the client stalls longer than the socket timeout.
+        """
+        with self._slot():
+            # Tenant dictionaries may be parsed and compiled here, so this
+            # work is bounded by the worker slots like the analysis itself.
+            extractor = self._extractor_for(tenant)
+            data = stream.read(length)
+            if len(data) < length:
+                raise IncompleteUploadError(
+                    f"Upload ended after {len(data)} of {length} bytes"
+                )
+            return self._analyze(data, filename, extractor, top_k)
+
+    def _extractor_for(self, tenant: str | None) -> SkillExtractor:
+        if tenant is None:
+            return self.extractor
+        if self.tenants is None:
+            raise UnknownTenantError(f"Unknown tenant: {tenant}")
+        return self.tenants.extractor(tenant)
+
+    @contextmanager
+    def _slot(self) -> Iterator[None]:
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise ServiceBusyError("All workers are busy")
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def _analyze(
+        self,
+        data: bytes,
+        filename: str,
+        extractor: SkillExtractor,
+        top_k: int | None,
+    ) -> dict[str, Any]:
+        _, resume_text = ExtractorRouter.extract_and_clean_bytes(
+            data, filename, cache=self.cache
+        )
+        return build_report(resume_text, extractor, self.role_index, top_k=top_k)
+
+
+class ResumeRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler delegating to the server's ``ResumeService``."""
+
+    server: ResumeHTTPServer
+
+    def setup(self) -> None:
+        # A client stalling on its headers or body fails the read instead of
+        # holding a thread, and a worker slot, indefinitely.
+        self.timeout = self.server.read_timeout
+        super().setup()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        LOGGER.info("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: HTTPStatus, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if urlparse(self.path).path == "/health":
+            service = self.server.service
+            self._send_json(
+                HTTPStatus.OK,
+                {
+                    "status": "ok",
+                    "roles": len(service.role_index.roles),
+                    "matchers": MATCHER_REGISTRY.stats(),
+                },
+            )
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        url = urlparse(self.path)
+        if url.path != "/analyze":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+
+        params = parse_qs(url.query)
+        filename = params.get("filename", [""])[0]
+        tenant = params.get("tenant", [None])[0]
+        try:
+            top_k = int(params["top_k"][0]) if "top_k" in params else None
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Invalid request"})
+            return
+        if top_k is not None and top_k < 1:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "top_k must be >= 1"})
+            return
+        if length < 0:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Invalid request"})
+            return
+        if length > self.server.max_upload_bytes:
+            self._send_json(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Upload too large"}
+            )
+            return
+
+        try:
+            report = self.server.service.analyze_stream(
+                self.rfile, length, filename, top_k=top_k, tenant=tenant
+            )
+        except UnknownTenantError as exc:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": str(exc)})
+        except TenantConfigError as exc:
+            LOGGER.error("Tenant configuration error for %s: %s", tenant, exc)
+            self._send_json(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": f"Configuration error for tenant {tenant}"},
+            )
+        except UnsupportedFileTypeError as exc:
+            self._send_json(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, {"error": str(exc)})
+        except ServiceBusyError as exc:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(exc)})
+        except IncompleteUploadError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        except TimeoutError:
+            LOGGER.warning("Upload of %s timed out", filename)
+            self._send_json(HTTPStatus.REQUEST_TIMEOUT, {"error": "Upload timed out"})
+            self.close_connection = True
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.exception("Analysis failed for %s: %s", filename, exc)
+            self._send_json(
+                HTTPStatus.UNPROCESSABLE_ENTITY, {"error": f"Analysis failed: {exc}"}
+            )
+        else:
+            self._send_json(HTTPStatus.OK, report)
+
+
+class ResumeHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server bound to one warm ``ResumeService``."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        service: ResumeService,
+        max_upload_bytes: int = DEFAULT_MAX_UPLOAD_BYTES,
+        read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        super().__init__(address, ResumeRequestHandler)
+        self.service = service
+        self.max_upload_bytes = max_upload_bytes
+        self.read_timeout = read_timeout
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build server argument parser."""
+    parser = argparse.ArgumentParser(description="Resume Profiling service")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8080, help="Bind port")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum concurrent analyses (default: 4)",
+    )
+    parser.add_argument(
+        "--max-upload-mb",
+        type=int,
+        default=DEFAULT_MAX_UPLOAD_BYTES // (1024 * 1024),
+        help="Maximum upload size in megabytes (default: 20)",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=DEFAULT_READ_TIMEOUT,
+        help="Seconds a client may stall while sending a request before it is "
+        "dropped with 408 (default: 30)",
+    )
+    parser.add_argument(
+        "--extractor-workers",
+        type=int,
+        default=1,
+        help="Processes one analysis may use for PDF and OCR extraction "
+        "(default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Optional directory for caching extracted text (default: no cache)",
+    )
+    parser.add_argument(
+        "--matcher-dir",
+        default=None,
+        help="Optional directory for the compiled skill matcher artifact, "
+        "built on first use and rebuilt when the skill dictionary changes "
+        "(default: compile at startup)",
+    )
+    parser.add_argument(
+        "--roles",
+        default=None,
+        help="Optional JSON or TOML role catalogue, reloaded when it changes "
+        "(default: built-in roles)",
+    )
+    parser.add_argument(
+        "--roles-check-seconds",
+        type=float,
+        default=RoleCatalog.CHECK_INTERVAL,
+        help="How often the role catalogue file is checked for changes "
+        "(default: 5)",
+    )
+    parser.add_argument(
+        "--tenants-dir",
+        default=None,
+        help="Optional directory of <tenant>.json skill dictionary overrides "
+        "selected with the tenant query parameter",
+    )
+    parser.add_argument(
+        "--matcher-cache-mb",
+        type=int,
+        default=MATCHER_REGISTRY.max_bytes // (1024 * 1024),
+        help="Memory budget for compiled tenant skill matchers in megabytes; "
+        "least recently used ones are evicted beyond it (default: 256)",
+    )
+    parser.add_argument(
+        "--log",
+        default=None,
+        help="Optional log file path (default: resume_profiling.log)",
+    )
+    return parser
+
+
+def main() -> None:
+    """Server entry point."""
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer")
+    if args.matcher_cache_mb < 1:
+        parser.error("--matcher-cache-mb must be a positive integer")
+    if args.roles_check_seconds < 0:
+        parser.error("--roles-check-seconds must not be negative")
+    if args.read_timeout <= 0:
+        parser.error("--read-timeout must be positive")
+    if args.extractor_workers < 1:
+        parser.error("--extractor-workers must be a positive integer")
+
+    configure_logging(log_file=args.log)
+    if args.matcher_dir:
+        SkillExtractor.ARTIFACT_DIR = Path(args.matcher_dir)
+    MATCHER_REGISTRY.max_bytes = args.matcher_cache_mb * 1024 * 1024
+    cache = ExtractionCache(args.cache_dir) if args.cache_dir else None
+    tenants = TenantDictionaries(args.tenants_dir) if args.tenants_dir else None
+    catalog = None
+    if args.roles:
+        catalog = RoleCatalog(args.roles, check_interval=args.roles_check_seconds)
+    service = ResumeService(
+        max_workers=args.workers,
+        cache=cache,
+        tenants=tenants,
+        catalog=catalog,
+        extractor_workers=args.extractor_workers,
+    )
+    server = ResumeHTTPServer(
+        (args.host, args.port),
+        service,
+        max_upload_bytes=args.max_upload_mb * 1024 * 1024,
+        read_timeout=args.read_timeout,
+    )
+    LOGGER.info("Serving on http://%s:%d", args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        LOGGER.info("Shutting down")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,20 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
 from typing import Iterable
 
 import regex as re
 
+from resume_profiling.compiled_matcher import (
+    MATCHER_REGISTRY,
+    CompiledMatcher,
+    dictionary_hash,
+    normalize_dictionary,
+)
+from resume_profiling.skill_trie import SkillTrie
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -163,21 +173,74 @@ class SkillExtractionResult:
 
 
 class SkillExtractor:
-    """Extract skills from resume text using dictionary and regex patterns."""
+    """Extract skills from resume text using dictionary and regex patterns.
+
+    Two matching engines are available: ``"trie"`` (default) scans the text
+    once for all skills, ``"regex"`` runs one compiled pattern per skill and
+    is kept as the reference implementation. Both return identical results.
+
+    Compiled matchers are shared through ``MATCHER_REGISTRY``: extractors
+    built from identical dictionaries in one process reuse the same trie or
+    pattern table. With an artifact directory (``artifact_dir`` or the
+    ``ARTIFACT_DIR`` class default) the trie engine loads its compiled
+    matcher from a ``CompiledMatcher`` artifact, writing it on first use.
+    """
+
+    ENGINES = ("trie", "regex")
+    ARTIFACT_DIR: Path | None = None
 
-    def __init__(self, skill_dictionary: Iterable[str] | None = None) -> None:
-        self.skill_dictionary = sorted(
-            {skill.lower() for skill in (skill_dictionary or SKILL_DICTIONARY)}
-        )
-        self._patterns = self._build_patterns()
+    def __init__(
+        self,
+        skill_dictionary: Iterable[str] | None = None,
+        engine: str = "trie",
+        artifact_dir: str | Path | None = None,
+    ) -> None:
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown skill extraction engine: {engine}")
+        self.engine = engine
+        dictionary = list(skill_dictionary or SKILL_DICTIONARY)
+        digest = dictionary_hash(dictionary)
+        pinned = dictionary == SKILL_DICTIONARY
+        self._patterns: dict[str, re.Pattern] = {}
+        self._trie: SkillTrie | None = None
+        if engine == "regex":
+            self.skill_dictionary, self._patterns = MATCHER_REGISTRY.get(
+                engine, digest, lambda: self._build_patterns(dictionary), pinned
+            )
+            return
 
-    def _build_patterns(self) -> dict[str, re.Pattern]:
+        artifact_dir = artifact_dir or self.ARTIFACT_DIR
+        if artifact_dir is None:
+            build = partial(CompiledMatcher.build, dictionary)
+        else:
+            build = partial(CompiledMatcher.load_or_build, dictionary, artifact_dir)
+        matcher = MATCHER_REGISTRY.get(engine, digest, build, pinned)
+        self.skill_dictionary = matcher.skills
+        self._trie = matcher.trie
+
+    @staticmethod
+    def _build_patterns(
+        dictionary: Iterable[str],
+    ) -> tuple[list[str], dict[str, re.Pattern]]:
+        skills = normalize_dictionary(dictionary)
         patterns: dict[str, re.Pattern] = {}
-        for skill in self.skill_dictionary:
+        for skill in skills:
             escaped = re.escape(skill)
             pattern = rf"(?<!\w){escaped}(?!\w)"
             patterns[skill] = re.compile(pattern, flags=re.IGNORECASE)
-        return patterns
+        return skills, patterns
+
+    def _count_with_patterns(self, text: str) -> dict[str, int]:
+        matches: dict[str, int] = {}
+        for skill, pattern in self._patterns.items():
+            found = pattern.findall(text)
+            if found:
+                matches[skill] = len(found)
+        return matches
+
+    def _count_with_trie(self, text: str) -> dict[str, int]:
+        counts = self._trie.count(text)
+        return {skill: counts[skill] for skill in sorted(counts)}
 
     def extract(self, text: str) -> SkillExtractionResult:
         """Extract skills from text.
@@ -188,12 +251,39 @@ class SkillExtractor:
         Returns:
             SkillExtractionResult with unique skills and counts.
         """
-        matches: dict[str, int] = {}
-        for skill, pattern in self._patterns.items():
-            found = pattern.findall(text)
-            if found:
-                matches[skill] = len(found)
+        if self._trie is not None:
+            matches = self._count_with_trie(text)
+        else:
+            matches = self._count_with_patterns(text)
+
+        return self._result(matches)
+
+    def extract_stream(self, chunks: Iterable[str]) -> SkillExtractionResult:
+        """Extract skills from cleaned text arriving in chunks.
+
+        With the trie engine only a short window of text is kept between
+        chunks, and skills spanning a chunk boundary are counted once. The
+        regex engine joins the chunks and is kept for reference.
+
+        Args:
+            chunks: Cleaned text chunks, as yielded by
+                ``TextCleaner.clean_stream``.
+
+        Returns:
+            SkillExtractionResult with unique skills and counts, identical to
+            ``extract`` on the concatenated text.
+        """
+        if self._trie is None:
+            return self.extract("".join(chunks))
+
+        counter = self._trie.counter()
+        for chunk in chunks:
+            counter.feed(chunk)
+        counts = counter.finish()
+        return self._result({skill: counts[skill] for skill in sorted(counts)})
 
+    @staticmethod
+    def _result(matches: dict[str, int]) -> SkillExtractionResult:
         skills = sorted(matches.keys())
         LOGGER.info("Extracted %d skills", len(skills))
         return SkillExtractionResult(skills=skills, matches=matches)
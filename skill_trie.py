@@ -0,0 +1,194 @@
+"""Single-pass dictionary matcher for skill extraction."""
+from __future__ import annotations
+
+import string
+from typing import Any, Iterable
+
+import regex as re
+
+
+_END = ""
+_ASCII_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_WORD_CHAR_PATTERN = re.compile(r"\w")
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True when char counts as ``\\w`` for the regex engine."""
+    if char.isascii():
+        return char in _ASCII_WORD_CHARS
+    return _WORD_CHAR_PATTERN.match(char) is not None
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase text while preserving character offsets."""
+    if text.isascii():
+        return text.lower()
+    folded = []
+    for char in text:
+        lowered = char.lower()
+        folded.append(lowered if len(lowered) == 1 else char)
+    return "".join(folded)
+
+
+class SkillTrie:
+    """Character trie that finds every dictionary skill in one scan.
+
+    Matching follows the semantics of the per-skill ``(?<!\\w)skill(?!\\w)``
+    patterns: a hit must not be preceded or followed by a word character,
+    different skills may overlap (``spring`` and ``spring boot``), and
+    repeated hits of the same skill are counted without overlap.
+    """
+
+    def __init__(self, skills: Iterable[str]) -> None:
+        self._root: dict[str, dict] = {}
+        self._max_length = 0
+        for skill in skills:
+            if skill:
+                self._insert(skill)
+                self._max_length = max(self._max_length, len(skill))
+        self._start_pattern = self._build_start_pattern()
+
+    def _insert(self, skill: str) -> None:
+        node = self._root
+        for char in skill:
+            node = node.setdefault(char, {})
+        node[_END] = skill
+
+    def _build_start_pattern(self) -> re.Pattern:
+        first_chars = "".join(re.escape(char) for char in sorted(self._root))
+        if not first_chars:
+            return re.compile(r"(?!)")
+        return re.compile(rf"(?<!\w)[{first_chars}]")
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return the trie as JSON serializable data for ``from_payload``."""
+        return {"max_length": self._max_length, "root": self._root}
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> SkillTrie:
+        """Rebuild a trie from ``to_payload`` data without re-inserting skills.
+
+        Args:
+            payload: Data returned by ``to_payload``.
+
+        Returns:
+            SkillTrie instance.
+        """
+        trie = cls.__new__(cls)
+        trie._root = payload["root"]
+        trie._max_length = int(payload["max_length"])
+        trie._start_pattern = trie._build_start_pattern()
+        return trie
+
+    @property
+    def max_length(self) -> int:
+        """Length of the longest skill in the trie."""
+        return self._max_length
+
+    def count(self, text: str) -> dict[str, int]:
+        """Count non-overlapping occurrences of each skill in text.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            Mapping of matched skill to occurrence count.
+        """
+        counts: dict[str, int] = {}
+        folded = _fold_case(text)
+        self._scan(folded, 0, len(folded), 0, counts, {})
+        return counts
+
+    def counter(self) -> SkillCounter:
+        """Return an incremental counter for text arriving in chunks."""
+        return SkillCounter(self)
+
+    def _scan(
+        self,
+        folded: str,
+        pos: int,
+        endpos: int,
+        offset: int,
+        counts: dict[str, int],
+        last_end: dict[str, int],
+    ) -> None:
+        """Count hits starting in ``folded[pos:endpos]``.
+
+        ``offset`` is the absolute position of ``folded[0]`` in the whole
+        text; ``last_end`` holds absolute end positions so that scans over
+        consecutive windows share the non-overlap bookkeeping.
+        """
+        length = len(folded)
+        root = self._root
+        for candidate in self._start_pattern.finditer(folded, pos, endpos):
+            start = candidate.start()
+            node = root
+            end = start
+            while end < length:
+                node = node.get(folded[end])
+                if node is None:
+                    break
+                end += 1
+                skill = node.get(_END)
+                if skill is None:
+                    continue
+                if end < length and _is_word_char(folded[end]):
+                    continue
+                if offset + start < last_end.get(skill, 0):
+                    continue
+                counts[skill] = counts.get(skill, 0) + 1
+                last_end[skill] = offset + end
+
+
+class SkillCounter:
+    """Count skills over text fed in consecutive chunks.
+
+    Only a window of ``max_length + 1`` characters is carried between
+    chunks, so memory stays bounded by the chunk size. Skills spanning a
+    chunk boundary are counted exactly once, and the final counts equal
+    ``SkillTrie.count`` on the concatenated text.
+    """
+
+    def __init__(self, trie: SkillTrie) -> None:
+        self._trie = trie
+        self._buffer = ""
+        self._offset = 0
+        self._scanned = 0
+        self._counts: dict[str, int] = {}
+        self._last_end: dict[str, int] = {}
+
+    def feed(self, text: str) -> None:
+        """Scan a chunk of text, holding back hits that may continue."""
+        if not text:
+            return
+        self._buffer += _fold_case(text)
+        # A hit starting before ``limit`` is decided without further input:
+        # the walk reads at most ``max_length`` characters plus one lookahead.
+        limit = len(self._buffer) - self._trie.max_length
+        if limit > self._scanned:
+            self._scan_until(limit)
+            # Keep one character before the next start for the lookbehind.
+            drop = self._scanned - 1
+            self._buffer = self._buffer[drop:]
+            self._offset += drop
+            self._scanned -= drop
+
+    def finish(self) -> dict[str, int]:
+        """Scan the remaining buffered text and return the counts.
+
+        The counter must not be fed again afterwards.
+        """
+        self._scan_until(len(self._buffer))
+        self._buffer = ""
+        return self._counts
+
+    def _scan_until(self, limit: int) -> None:
+        self._trie._scan(
+            self._buffer,
+            self._scanned,
+            limit,
+            self._offset,
+            self._counts,
+            self._last_end,
+        )
+        self._scanned = limit
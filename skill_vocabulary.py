@@ -0,0 +1,71 @@
+"""Stable integer IDs for skills and bitset encoding of skill sets."""
+from __future__ import annotations
+
+from typing import Iterable
+
+from resume_profiling.skill_extractor import SKILL_DICTIONARY
+
+
+class SkillVocabulary:
+    """Intern skill names to stable integer IDs.
+
+    IDs follow the order of first appearance, starting with
+    ``SKILL_DICTIONARY`` for the default vocabulary, so the same skill keeps
+    the same ID across processes. A skill set is represented as a Python
+    int whose bit ``i`` is set when the skill with ID ``i`` is present, which
+    turns intersections into ``&`` and overlap counts into popcounts.
+    """
+
+    def __init__(self, skills: Iterable[str] = ()) -> None:
+        self.skill_ids: dict[str, int] = {}
+        self.names: list[str] = []
+        for skill in skills:
+            self.add(skill)
+
+    @classmethod
+    def from_dictionary(cls, extra_skills: Iterable[str] = ()) -> SkillVocabulary:
+        """Build a vocabulary seeded with ``SKILL_DICTIONARY``.
+
+        Args:
+            extra_skills: Skills appended after the dictionary entries.
+
+        Returns:
+            SkillVocabulary instance.
+        """
+        vocabulary = cls(skill.lower() for skill in SKILL_DICTIONARY)
+        for skill in extra_skills:
+            vocabulary.add(skill)
+        return vocabulary
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, skill: str) -> int:
+        """Return the ID of a skill, assigning the next free ID if new."""
+        skill_id = self.skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = len(self.names)
+            self.skill_ids[skill] = skill_id
+            self.names.append(skill)
+        return skill_id
+
+    def encode(self, skills: Iterable[str]) -> int:
+        """Encode skills as a bitset, ignoring skills not in the vocabulary."""
+        bits = 0
+        skill_ids = self.skill_ids
+        for skill in skills:
+            skill_id = skill_ids.get(skill)
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def decode(self, bits: int) -> list[str]:
+        """Materialize a bitset as a sorted list of skill names."""
+        names = self.names
+        skills: list[str] = []
+        while bits:
+            lowest = bits & -bits
+            skills.append(names[lowest.bit_length() - 1])
+            bits ^= lowest
+        skills.sort()
+        return skills
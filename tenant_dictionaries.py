@@ -0,0 +1,175 @@
+"""Per-tenant skill dictionaries built from the base dictionary plus overrides.
+
+A tenant's overrides are registered in code or read from
+``<directory>/<tenant>.json``::
+
+    {"add": ["guidewire", "duck creek"], "remove": ["r", "go"]}
+
+Each distinct resulting dictionary is compiled once per process and shared
+through ``MATCHER_REGISTRY``, whose LRU and memory bounds cap the compiled
+matchers kept for rarely seen tenants.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from resume_profiling.skill_extractor import SKILL_DICTIONARY, SkillExtractor
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+_TENANT_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,63}")
+
+
+class UnknownTenantError(LookupError):
+    """Raised when a tenant has no registered or stored overrides."""
+
+
+class TenantConfigError(ValueError):
+    """Raised when a tenant's stored overrides cannot be read or parsed."""
+
+
+@dataclass(frozen=True)
+class TenantOverrides:
+    """Skills a tenant adds to and removes from the base dictionary."""
+
+    add: tuple[str, ...] = ()
+    remove: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> TenantOverrides:
+        """Build overrides from ``{"add": [...], "remove": [...]}`` data.
+
+        Raises:
+            ValueError: If the payload is not an object of string lists.
+        """
+        if not isinstance(payload, dict):
+            raise ValueError("Tenant overrides must be a JSON object")
+        add = payload.get("add", [])
+        remove = payload.get("remove", [])
+        if not (
+            isinstance(add, list)
+            and isinstance(remove, list)
+            and all(isinstance(skill, str) for skill in [*add, *remove])
+        ):
+            raise ValueError("Tenant overrides must be lists of strings")
+        return cls(tuple(add), tuple(remove))
+
+    def apply(self, base: Iterable[str]) -> list[str]:
+        """Return the base skills without removed ones, followed by additions."""
+        removed = {skill.lower() for skill in self.remove}
+        skills = [skill for skill in base if skill.lower() not in removed]
+        skills.extend(skill for skill in self.add if skill.lower() not in removed)
+        return skills
+
+
+class TenantDictionaries:
+    """Resolve tenants to skill dictionaries and shared skill extractors.
+
+    Stored overrides are read on first use and re-read when their file
+    changes. Resolved dictionaries are cached per tenant; compiled matchers
+    are cached process-wide by dictionary content, so tenants with identical
+    overrides share one.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        base: Iterable[str] | None = None,
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self.base = list(base or SKILL_DICTIONARY)
+        self._registered: dict[str, TenantOverrides] = {}
+        # tenant -> (file mtime or None when registered, resolved dictionary)
+        self._resolved: dict[str, tuple[float | None, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, tenant_id: str, add: Iterable[str] = (), remove: Iterable[str] = ()
+    ) -> None:
+        """Register or replace a tenant's overrides in memory.
+
+        Args:
+            tenant_id: Tenant identifier.
+            add: Skills added to the base dictionary.
+            remove: Skills removed from the base dictionary.
+        """
+        self._check_id(tenant_id)
+        with self._lock:
+            self._registered[tenant_id] = TenantOverrides(tuple(add), tuple(remove))
+            self._resolved.pop(tenant_id, None)
+
+    def dictionary(self, tenant_id: str) -> list[str]:
+        """Return a tenant's skill dictionary.
+
+        Args:
+            tenant_id: Tenant identifier.
+
+        Returns:
+            Base skills with the tenant's overrides applied.
+
+        Raises:
+            UnknownTenantError: If the tenant has no overrides.
+            TenantConfigError: If the tenant's overrides file is malformed.
+        """
+        self._check_id(tenant_id)
+        with self._lock:
+            overrides = self._registered.get(tenant_id)
+            if overrides is not None:
+                cached = self._resolved.get(tenant_id)
+                if cached is None:
+                    cached = (None, overrides.apply(self.base))
+                    self._resolved[tenant_id] = cached
+                return cached[1]
+
+        path = self._path(tenant_id)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            raise UnknownTenantError(f"Unknown tenant: {tenant_id}") from None
+        with self._lock:
+            cached = self._resolved.get(tenant_id)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        try:
+            overrides = TenantOverrides.from_dict(
+                json.loads(path.read_text(encoding="utf-8"))
+            )
+        except (OSError, ValueError) as exc:
+            raise TenantConfigError(
+                f"Invalid skill overrides in {path}: {exc}"
+            ) from exc
+        dictionary = overrides.apply(self.base)
+        with self._lock:
+            self._resolved[tenant_id] = (mtime, dictionary)
+        LOGGER.info("Loaded skill overrides for tenant %s", tenant_id)
+        return dictionary
+
+    def extractor(self, tenant_id: str, engine: str = "trie") -> SkillExtractor:
+        """Return a skill extractor for a tenant's dictionary.
+
+        Args:
+            tenant_id: Tenant identifier.
+            engine: Skill extraction engine.
+
+        Returns:
+            SkillExtractor sharing the compiled matcher of the dictionary.
+        """
+        return SkillExtractor(self.dictionary(tenant_id), engine=engine)
+
+    def _path(self, tenant_id: str) -> Path:
+        if self.directory is None:
+            raise UnknownTenantError(f"Unknown tenant: {tenant_id}")
+        return self.directory / f"{tenant_id}.json"
+
+    @staticmethod
+    def _check_id(tenant_id: str) -> None:
+        if not _TENANT_ID.fullmatch(tenant_id):
+            raise UnknownTenantError(f"Invalid tenant id: {tenant_id!r}")
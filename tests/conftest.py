@@ -0,0 +1,8 @@
+"""Make the ``resume_profiling`` package importable from a source checkout."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).absolute().parents[2]))
@@ -0,0 +1,84 @@
+"""Streaming JSON extraction against ``json.load``."""
+from __future__ import annotations
+
+import io
+import json
+import random
+
+import pytest
+
+from resume_profiling.extractors.json_extractor import (
+    _iter_fragments,
+    _iter_stream_fragments,
+)
+
+
+DOCUMENTS = [
+    '{"name": "Ada", "skills": ["python", "sql"], "years": 7, "remote": true}',
+    '[1, -2.5e3, null, false, "caf\\u00e9 \\"bar\\""]',
+    '{"a": {"b": [[], {}, [{"c": "d"}]]}}',
+    "[NaN, Infinity, -Infinity]",
+    '  "plain"  ',
+    "0",
+]
+INVALID = [
+    "[1 2]",
+    '{"a" "b"}',
+    "{:}",
+    "[1,]",
+    '{"a": 1,}',
+    "[,1]",
+    "[1]]",
+    "[[1]",
+    "1 2",
+    "{1: 2}",
+    "[tru]",
+    "[01]",
+    '"a\x01b"',
+    '"open',
+    "",
+]
+
+
+def _stream(text: str, chunk_size: int) -> list[str]:
+    return list(_iter_stream_fragments(io.StringIO(text), chunk_size, "doc"))
+
+
+def _parse(text: str) -> list[str] | None:
+    try:
+        return list(_iter_fragments(json.loads(text)))
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 4096])
+def test_stream_matches_json_load(chunk_size: int) -> None:
+    for text in DOCUMENTS:
+        assert _stream(text, chunk_size) == _parse(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+@pytest.mark.parametrize("text", INVALID)
+def test_stream_rejects_invalid_json(text: str, chunk_size: int) -> None:
+    assert _parse(text) is None
+    with pytest.raises(json.JSONDecodeError):
+        _stream(text, chunk_size)
+
+
+def test_stream_agrees_with_json_load_on_random_token_sequences() -> None:
+    rng = random.Random(0)
+    tokens = ["{", "}", "[", "]", ":", ",", '"a"', "1", "-2.5", "true", " ", "x"]
+    for _ in range(20000):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 10)))
+        try:
+            streamed = _stream(text, rng.choice([1, 2, 5, 100]))
+        except json.JSONDecodeError:
+            streamed = None
+        assert streamed == _parse(text)
+
+
+def test_stream_fails_at_invalid_token_without_reading_ahead() -> None:
+    handle = io.StringIO("[1, @" + "a" * 1_000_000 + "]")
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_stream_fragments(handle, 100, "doc"))
+    assert handle.tell() < 1000
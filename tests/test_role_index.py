@@ -0,0 +1,157 @@
+"""Role index scoring against the per-role matcher and scoring engine."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from resume_profiling.job_roles import JOB_ROLES, JobRole
+from resume_profiling.matcher import SkillMatcher
+from resume_profiling.role_index import RoleIndex
+from resume_profiling.scoring_engine import ScoringEngine
+
+
+def _ranking(results: list[dict]) -> list[tuple[str, float]]:
+    return [(result["role"], result["score_result"].score) for result in results]
+
+
+def _full_top_k(index: RoleIndex, counts: dict[str, int], k: int) -> list:
+    results = index.score_all(list(counts), counts)
+    results.sort(key=lambda result: result["score_result"].score, reverse=True)
+    return _ranking(results[:k])
+
+
+def _reference(role: JobRole, counts: dict[str, int]) -> tuple:
+    resume_skills = sorted(counts)
+    job_counts = {skill: 1 for skill in role.skills}
+    match_result = SkillMatcher.compare(
+        resume_skills, role.skills, counts, job_counts
+    )
+    score_result = ScoringEngine.score(
+        match_percentage=match_result.match_percentage,
+        resume_skills=resume_skills,
+        job_skills=role.skills,
+        resume_counts=counts,
+        job_counts=job_counts,
+    )
+    return match_result, score_result
+
+
+def _random_resumes(
+    rng: random.Random, skills: list[str], count: int
+) -> list[dict[str, int]]:
+    resumes = []
+    for _ in range(count):
+        chosen = rng.sample(skills, rng.randint(0, min(25, len(skills))))
+        counts = {skill: rng.randint(1, 5) for skill in chosen}
+        counts.update({f"unlisted-{i}": 1 for i in range(rng.randint(0, 10))})
+        resumes.append(counts)
+    return resumes
+
+
+def _catalogues() -> list[list[JobRole]]:
+    rng = random.Random(1)
+    pool = [f"skill-{i}" for i in range(30)]
+    roles = []
+    for number in range(40):
+        skills = rng.sample(pool, rng.randint(1, 8))
+        # Catalogues may repeat a skill within a role.
+        skills += rng.choices(skills, k=rng.randint(0, 2))
+        roles.append(JobRole(name=f"Role {number}", category="X", skills=skills))
+    return [JOB_ROLES, roles]
+
+
+@pytest.fixture(scope="module")
+def index() -> RoleIndex:
+    return RoleIndex(JOB_ROLES)
+
+
+@pytest.mark.parametrize("roles", _catalogues(), ids=["builtin", "random"])
+def test_score_all_matches_per_role_scoring(roles: list[JobRole]) -> None:
+    index = RoleIndex(roles)
+    skills = sorted({skill for role in roles for skill in role.skills})
+    for counts in _random_resumes(random.Random(2), skills, 100):
+        results = index.score_all(list(counts), counts)
+        assert [result["role"] for result in results] == [r.name for r in roles]
+        for role, result in zip(roles, results):
+            match_result, score_result = _reference(role, counts)
+            actual_match = result["match_result"]
+            assert actual_match.strength_skills == match_result.strength_skills
+            assert actual_match.missing_skills == match_result.missing_skills
+            assert actual_match.match_percentage == pytest.approx(
+                match_result.match_percentage
+            )
+            assert actual_match.cosine_similarity == pytest.approx(
+                match_result.cosine_similarity
+            )
+            actual_score = result["score_result"]
+            assert actual_score.score == pytest.approx(score_result.score)
+            assert actual_score.coverage == pytest.approx(score_result.coverage)
+            assert actual_score.diversity == pytest.approx(score_result.diversity)
+            assert actual_score.keyword_strength == pytest.approx(
+                score_result.keyword_strength
+            )
+
+
+@pytest.mark.parametrize("roles", _catalogues(), ids=["builtin", "random"])
+def test_score_batch_matches_score_all(roles: list[JobRole]) -> None:
+    index = RoleIndex(roles)
+    skills = sorted({skill for role in roles for skill in role.skills})
+    resumes = _random_resumes(random.Random(3), skills, 100)
+    batch = index.score_batch(resumes)
+    assert len(batch.scores) == len(resumes)
+    for resume_idx, counts in enumerate(resumes):
+        results = index.score_all(list(counts), counts)
+        assert list(batch.scores[resume_idx]) == [
+            result["score_result"].score for result in results
+        ]
+        for role_idx, result in enumerate(results):
+            match_result = result["match_result"]
+            assert (
+                batch.matched_skills(resume_idx, role_idx)
+                == match_result.strength_skills
+            )
+            assert (
+                batch.missing_skills(resume_idx, role_idx)
+                == match_result.missing_skills
+            )
+
+
+def test_top_k_is_prefix_of_full_ranking(index: RoleIndex) -> None:
+    rng = random.Random(0)
+    skills = sorted({skill for role in JOB_ROLES for skill in role.skills})
+    for _ in range(300):
+        chosen = rng.sample(skills, rng.randint(0, 25))
+        counts = {skill: rng.randint(1, 5) for skill in chosen}
+        # Skills no role lists only raise diversity.
+        counts.update({f"unlisted-{i}": 1 for i in range(rng.randint(0, 10))})
+        k = rng.choice([1, 3, 5, 20, len(JOB_ROLES) + 1])
+        top = _ranking(index.score_top_k(list(counts), counts, k))
+        assert top == _full_top_k(index, counts, k)
+
+
+def test_top_k_without_skills_ranks_roles(index: RoleIndex) -> None:
+    top = index.score_top_k([], {}, 3)
+    assert _ranking(top) == _full_top_k(index, {}, 3)
+    assert len(top) == 3
+
+
+def test_disjoint_roles_tied_on_diversity_keep_catalogue_order() -> None:
+    roles = [
+        JobRole(name="Long", category="A", skills=["a", "b", "c", "d"]),
+        JobRole(name="Short", category="A", skills=["e"]),
+        JobRole(name="Match", category="A", skills=["python", "x", "y", "z"]),
+    ]
+    index = RoleIndex(roles)
+    counts = {f"s{i}": 1 for i in range(5)} | {"python": 1}
+    for k in (1, 2, 3):
+        top = _ranking(index.score_top_k(list(counts), counts, k))
+        assert top == _full_top_k(index, counts, k)
+
+
+def test_restored_index_ranks_like_built_index(index: RoleIndex) -> None:
+    restored = RoleIndex.from_state(index.to_state())
+    counts = {"python": 2, "sql": 1, "tableau": 1}
+    assert _ranking(restored.score_top_k(list(counts), counts, 5)) == _ranking(
+        index.score_top_k(list(counts), counts, 5)
+    )
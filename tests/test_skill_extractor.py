@@ -0,0 +1,79 @@
+"""Equivalence of the trie skill matcher with the regex reference."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from resume_profiling.skill_extractor import SKILL_DICTIONARY, SkillExtractor
+from resume_profiling.text_cleaner import TextCleaner
+
+
+# Separators around skills, including characters that belong to skills
+# (``c++``, ``c#``, ``.net``, ``node.js``) and word characters that must
+# suppress a match.
+SEPARATORS = [" ", "  ", "\n", ", ", ".", "/", "-", "+", "#", "_", "x", "9", "é"]
+
+
+@pytest.fixture(scope="module")
+def extractors() -> tuple[SkillExtractor, SkillExtractor]:
+    return SkillExtractor(engine="trie"), SkillExtractor(engine="regex")
+
+
+def _random_texts(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    skills = list(SKILL_DICTIONARY)
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(0, 40)):
+            skill = rng.choice(skills)
+            if rng.random() < 0.3:
+                skill = skill.upper() if rng.random() < 0.5 else skill.title()
+            if rng.random() < 0.2:
+                cut = rng.randint(0, len(skill))
+                skill = skill[:cut] + rng.choice(SEPARATORS) + skill[cut:]
+            parts.append(skill)
+            parts.append(rng.choice(SEPARATORS))
+        texts.append("".join(parts))
+    return texts
+
+
+def test_trie_matches_regex_on_raw_text(extractors) -> None:
+    trie, regex = extractors
+    for text in _random_texts(2000):
+        assert trie.extract(text) == regex.extract(text)
+
+
+def test_trie_matches_regex_on_cleaned_text(extractors) -> None:
+    trie, regex = extractors
+    for text in _random_texts(2000, seed=1):
+        cleaned = TextCleaner.clean(text)
+        assert trie.extract(cleaned) == regex.extract(cleaned)
+
+
+def test_extract_stream_matches_extract_for_random_chunk_splits(extractors) -> None:
+    trie, regex = extractors
+    rng = random.Random(2)
+    for text in _random_texts(1000, seed=3):
+        cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 8)))
+        chunks = [text[i:j] for i, j in zip([0, *cuts], [*cuts, len(text)])]
+        expected = regex.extract(text)
+        assert trie.extract_stream(chunks) == expected
+        assert regex.extract_stream(chunks) == expected
+
+
+def test_engines_agree_on_custom_dictionary() -> None:
+    dictionary = ["C++", "c#", "Node.js", "r", "go", "machine learning"]
+    text = "Go, R and C++/C# with node.js; machine  learning; machine learning"
+    trie = SkillExtractor(dictionary, engine="trie")
+    regex = SkillExtractor(dictionary, engine="regex")
+    assert trie.extract(text) == regex.extract(text)
+    assert trie.extract(text).matches == {
+        "c#": 1,
+        "c++": 1,
+        "go": 1,
+        "machine learning": 1,
+        "node.js": 1,
+        "r": 1,
+    }
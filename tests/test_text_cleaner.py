@@ -0,0 +1,63 @@
+"""Equivalence of the text cleaning engines with the regex reference."""
+from __future__ import annotations
+
+import random
+import sys
+
+import pytest
+
+from resume_profiling.text_cleaner import TextCleaner
+
+
+# Characters the cleaning rules treat differently: kept ASCII, removed ASCII,
+# control characters, Unicode whitespace, letters with case mappings and a
+# lone surrogate.
+ALPHABET = (
+    "abcXYZ019+#.-/ _!@$%^&*()[]{}'\"\t\n\r\x0b\x0c\x00\x1f\x7f\x85\x9f\xa0"
+    "\u1680\u2000\u2028\u2029\u3000\ufeff\xe9\xdf\u0130\u0131\u212a"
+    "\u03a3\u03c2\u65e5\U0001f600\ud800"
+)
+
+
+def _random_texts(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 80)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("start", range(0, sys.maxunicode + 1, 0x10000))
+def test_translate_matches_regex_for_every_code_point(start: int) -> None:
+    # Each code point sits between kept letters, so both its replacement and
+    # its effect on the surrounding whitespace are compared.
+    text = "".join(f"a{chr(code)}b " for code in range(start, start + 0x10000))
+    assert TextCleaner.clean_translate(text) == TextCleaner.clean_regex(text)
+
+
+def test_translate_matches_regex_on_random_text() -> None:
+    for text in _random_texts(5000):
+        assert TextCleaner.clean_translate(text) == TextCleaner.clean_regex(text)
+
+
+def test_clean_uses_selected_engine() -> None:
+    text = "Senior  Python/C++ Developer\t(AWS, C#)\n"
+    expected = TextCleaner.clean_regex(text)
+    assert TextCleaner.clean(text) == expected
+    assert TextCleaner.clean(text, engine="regex") == expected
+    with pytest.raises(ValueError):
+        TextCleaner.clean(text, engine="unknown")
+
+
+def test_clean_stream_matches_clean_for_random_chunk_splits() -> None:
+    rng = random.Random(1)
+    for text in _random_texts(2000, seed=2):
+        cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 6)))
+        chunks = [text[i:j] for i, j in zip([0, *cuts], [*cuts, len(text)])]
+        assert "".join(TextCleaner.clean_stream(chunks)) == TextCleaner.clean(text)
+
+
+def test_clean_stream_handles_empty_and_blank_chunks() -> None:
+    chunks = ["", "  ", "Python", "", "\n", "SQL ", "", " AWS", "  "]
+    assert "".join(TextCleaner.clean_stream(chunks)) == "python sql aws"
+    assert list(TextCleaner.clean_stream([])) == []
@@ -1,18 +1,40 @@
 """Text normalization utilities."""
 from __future__ import annotations
 
+import string
+from typing import Iterable, Iterator
+
 import regex as re
 
 
+def _build_ascii_table() -> bytes:
+    """Map kept ASCII characters to their lowercase form, all others to space."""
+    kept = set(string.ascii_letters + string.digits + "+#.-/")
+    return bytes(
+        ord(chr(code).lower()) if chr(code) in kept else ord(" ")
+        for code in range(256)
+    )
+
+
 class TextCleaner:
-    """Clean and normalize extracted text."""
+    """Clean and normalize extracted text.
+
+    Two engines produce identical output: ``"translate"`` (default) maps every
+    character through one precomputed byte table and collapses whitespace
+    once, ``"regex"`` applies the original substitution passes and is kept as
+    the reference implementation.
+    """
 
     NON_PRINTABLE_PATTERN = re.compile(r"[\x00-\x1f\x7f-\x9f]")
     SPECIAL_CHAR_PATTERN = re.compile(r"[^a-zA-Z0-9\s\+\#\.\-/]")
     WHITESPACE_PATTERN = re.compile(r"\s+")
 
+    ENGINES = ("translate", "regex")
+    ENGINE = "translate"
+    _ASCII_TABLE = _build_ascii_table()
+
     @classmethod
-    def clean(cls, text: str) -> str:
+    def clean(cls, text: str, engine: str | None = None) -> str:
         """Clean extracted text.
 
         Steps:
@@ -23,12 +45,71 @@ class TextCleaner:
 
         Args:
             text: Raw extracted text.
+            engine: Cleaning engine; defaults to ``ENGINE``.
 
         Returns:
             Cleaned text.
+
+        Raises:
+            ValueError: If the engine is unknown.
         """
+        engine = engine or cls.ENGINE
+        if engine == "translate":
+            return cls.clean_translate(text)
+        if engine == "regex":
+            return cls.clean_regex(text)
+        raise ValueError(f"Unknown text cleaning engine: {engine}")
+
+    @classmethod
+    def clean_regex(cls, text: str) -> str:
+        """Clean text with one regex pass per step (reference implementation)."""
         text = cls.NON_PRINTABLE_PATTERN.sub(" ", text)
         text = cls.SPECIAL_CHAR_PATTERN.sub(" ", text)
         text = text.lower()
         text = cls.WHITESPACE_PATTERN.sub(" ", text).strip()
         return text
+
+    @classmethod
+    def clean_translate(cls, text: str) -> str:
+        """Clean text with a single table lookup per character.
+
+        Only ASCII letters, digits and ``+#.-/`` survive cleaning, so every
+        non-ASCII character is first encoded as ``?``, which the table maps to
+        a space like any other removed character.
+        """
+        return " ".join(cls._translate(text).split())
+
+    @classmethod
+    def clean_stream(cls, chunks: Iterable[str]) -> Iterator[str]:
+        """Clean text arriving in chunks without joining it first.
+
+        Concatenating the yielded pieces gives exactly ``clean`` of the
+        concatenated chunks: words split across chunks stay joined and
+        whitespace runs spanning chunks collapse to one space.
+
+        Args:
+            chunks: Raw text chunks in document order.
+
+        Yields:
+            Cleaned text pieces.
+        """
+        started = False
+        pending_space = False
+        for chunk in chunks:
+            translated = cls._translate(chunk)
+            words = translated.split()
+            if not words:
+                pending_space = pending_space or bool(translated)
+                continue
+            piece = " ".join(words)
+            if started and (pending_space or translated[0] == " "):
+                piece = " " + piece
+            started = True
+            pending_space = translated[-1] == " "
+            yield piece
+
+    @classmethod
+    def _translate(cls, text: str) -> str:
+        """Map each character to its cleaned form, one character per input."""
+        data = text.encode("ascii", "replace").translate(cls._ASCII_TABLE)
+        return data.decode("ascii")